@@ -1,5 +1,6 @@
 from .accountManager import AccountManager
 from .config import config
+from .progress import ProgressReporter
 
 def setup(bot):
     bot.add_cog(AccountManager(bot))
\ No newline at end of file
@@ -1,4 +1,6 @@
 from .config import config
+from .ballchasing import BallchasingClient
+from .jobs import JobScheduler
 from datetime import datetime, timezone
 import tempfile
 import discord
@@ -24,8 +26,16 @@ class AccountManager(commands.Cog):
         self.config = Config.get_conf(self, identifier=1234567893, force_registration=True)
         self.config.register_global(**global_defaults)
         self.config.register_guild(**defaults)
+        self.bc_client = BallchasingClient()
+        self.job_scheduler = JobScheduler()
+        self.account_register_version = 0   # bumped on every account register change so dependent cogs can rebuild their indexes
         # TODO: self.token = await self._auth_token # load on_ready
 
+    def cog_unload(self):
+        """Clean up when cog shuts down."""
+        self.job_scheduler.cancel_all()
+        asyncio.create_task(self.bc_client.close())
+
     @commands.command(aliases=['setBCAuthKey', 'setGuildBCAuthToken'])
     @commands.guild_only()
     @checks.admin_or_permissions(manage_guild=True)
@@ -278,6 +288,7 @@ class AccountManager(commands.Cog):
                 return False
             
             del account_register[discord_id]
+            await self._save_account_register(account_register)
             await ctx.send(":white_check_mark: Removed **{}** account(s).".format(count))
         else:
             await ctx.send("No account found.")
@@ -385,6 +396,36 @@ class AccountManager(commands.Cog):
                     members = ""
         await ctx.send(output + "```\n{}\n```".format(member_lines))
 
+    @commands.command(aliases=['jobStatus'])
+    @commands.guild_only()
+    async def jobs(self, ctx):
+        """Lists background jobs (group copies, summaries, etc.) running or queued in this guild"""
+        jobs = self.job_scheduler.jobs(ctx.guild.id)
+        lines = []
+        for job in jobs:
+            owner = ctx.guild.get_member(job.owner_id) if job.owner_id else None
+            lines.append("`{}` **{}** - {} {}s{}".format(
+                job.id, job.name, job.status, int(job.age()), " ({})".format(owner.display_name) if owner else ""))
+        if not lines:
+            lines.append("No background jobs.")
+
+        interactive = self.bc_queue_depth(priority=config.bc_interactive_priority)
+        background = self.bc_queue_depth(priority=config.bc_background_priority)
+        lines.append("\nBallchasing requests waiting: {} interactive, {} background".format(interactive, background))
+        await ctx.send("\n".join(lines))
+
+    @commands.command(aliases=['cancelJobs'])
+    @commands.guild_only()
+    async def cancelJob(self, ctx, job_id: int):
+        """Cancels a queued or running background job. Members may cancel their own jobs, admins may cancel any job."""
+        job = self.job_scheduler.get(job_id)
+        if not job or job.guild_id != ctx.guild.id or not job.active:
+            return await ctx.send(":x: No active job with id `{}`.".format(job_id))
+        if job.owner_id != ctx.author.id and not ctx.author.guild_permissions.manage_guild:
+            return await ctx.send(":x: Only the member who started this job or an admin can cancel it.")
+        self.job_scheduler.cancel(job_id)
+        await ctx.send(":white_check_mark: Cancelled job `{}` ({}).".format(job.id, job.name))
+
 
     async def _get_member_accounts(self, member):
         accs = []
@@ -417,63 +458,31 @@ class AccountManager(commands.Cog):
 
 # ballchasing
     # TODO: Update requests to not require guild - auth_token defaults to preloaded data
-    async def bc_delete_request(self, auth_token, endpoint, params=[]):
-        url = 'https://ballchasing.com/api'
-        url += endpoint
-        # params = [urllib.parse.quote(p) for p in params]
-        params = '&'.join(params)
-        if params:
-            url += "?{}".format(params)
-
-        # url = urllib.parse.quote_plus(url)
-        loop = asyncio.get_event_loop()
-        future = loop.run_in_executor(None, lambda: requests.delete(
-            url, headers={'Authorization': auth_token}))
-        response = await future
-        return response
-
-    async def bc_get_request(self, auth_token, endpoint, params=[]):
-        url = 'https://ballchasing.com/api'
-        url += endpoint
-        # params = [urllib.parse.quote(p) for p in params]
-        params = '&'.join(params)
-        if params:
-            url += "?{}".format(params)
-
-        # url = urllib.parse.quote_plus(url)
-        loop = asyncio.get_event_loop()
-        future = loop.run_in_executor(None, lambda: requests.get(
-            url, headers={'Authorization': auth_token}))
-        response = await future
-        return response
-
-    async def bc_post_request(self, auth_token, endpoint, params=[], json=None, data=None, files=None):
-        url = 'https://ballchasing.com/api'
-        url += endpoint
-        params = '&'.join(params)
-        if params:
-            url += "?{}".format(params)
-
-        # return requests.post(url, headers={'Authorization': auth_token}, json=json, data=data, files=files)
-        loop = asyncio.get_event_loop()
-        future = loop.run_in_executor(None, lambda: requests.post(
-            url, headers={'Authorization': auth_token}, json=json, data=data, files=files))
-        response = await future
-        return response
-
-    async def bc_patch_request(self, auth_token, endpoint, params=[], json=None, data=None):
-        url = 'https://ballchasing.com/api'
-        url += endpoint
-        params = '&'.join(params)
-        if params:
-            url += "?{}".format(params)
-
-        # return requests.patch(url, headers={'Authorization': auth_token}, json=json, data=data)
-        loop = asyncio.get_event_loop()
-        future = loop.run_in_executor(None, lambda: requests.patch(
-            url, headers={'Authorization': auth_token}, json=json, data=data))
-        response = await future
-        return response
+    async def bc_delete_request(self, auth_token, endpoint, params=[], priority=config.bc_interactive_priority):
+        return await self.bc_client.delete(auth_token, endpoint, params, priority=priority)
+
+    async def bc_get_request(self, auth_token, endpoint, params=[], priority=config.bc_interactive_priority):
+        return await self.bc_client.get(auth_token, endpoint, params, priority=priority)
+
+    async def bc_post_request(self, auth_token, endpoint, params=[], json=None, data=None, files=None, priority=config.bc_interactive_priority):
+        return await self.bc_client.post(auth_token, endpoint, params, json=json, data=data, files=files, priority=priority)
+
+    async def bc_patch_request(self, auth_token, endpoint, params=[], json=None, data=None, priority=config.bc_interactive_priority):
+        return await self.bc_client.patch(auth_token, endpoint, params, json=json, data=data, priority=priority)
+
+    async def bc_transfer_replays(self, source_token, replay_ids, dest_token, params=[], priority=config.bc_interactive_priority):
+        return await self.bc_client.transfer_replays(source_token, replay_ids, dest_token, params, priority=priority)
+
+    def bc_queue_depth(self, auth_token=None, priority=None):
+        """Number of ballchasing requests waiting on the rate limiter"""
+        return self.bc_client.queue_depth(auth_token, priority)
+
+# background jobs
+    def submit_job(self, guild, name, key, func, *args, owner=None, guild_limited=True):
+        """Runs func(*args) as a background job, subject to the job concurrency limits.
+        Jobs that members aren't waiting on can pass guild_limited=False so they don't hold one of the guild's job slots.
+        Returns (job, created) -- created is False when an identical job (same key) is already queued or running."""
+        return self.job_scheduler.submit(guild.id, name, key, func, *args, owner_id=owner.id if owner else None, guild_limited=guild_limited)
 
 # other commands
     async def invalid_account_prompt(self, ctx, member, platform, identifier):
@@ -624,6 +633,7 @@ class AccountManager(commands.Cog):
     
     async def _save_account_register(self, account_register):
         await self.config.AccountRegister.set(account_register)
+        self.account_register_version += 1
 
     async def _get_member_bc_token(self, member: discord.Member):
         try:
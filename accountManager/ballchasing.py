@@ -0,0 +1,261 @@
+from .config import config
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import json as jsonlib
+import itertools
+import asyncio
+import random
+import heapq
+import time
+import aiohttp
+from aiohttp.payload import AsyncIterablePayload
+
+IDEMPOTENT_METHODS = ['GET', 'HEAD', 'PUT', 'DELETE']
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+
+class BCResponse:
+    """Buffered ballchasing API response. Exposes the parts of requests.Response the cogs rely on."""
+
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        if not self.content:
+            return {}
+        return jsonlib.loads(self.content)
+
+
+class _TokenBucket:
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.waiters = []       # heap of (priority, seq, future)
+        self.drainer = None
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class TokenRateLimiter:
+    """Token bucket rate limiter keyed on the ballchasing auth token.
+    Requests waiting on a bucket are released lowest priority value first, then in arrival order.
+    """
+
+    def __init__(self, rate=config.bc_rate_limit, burst=config.bc_rate_burst):
+        self.rate = rate
+        self.burst = burst
+        self._buckets = {}
+        self._seq = itertools.count()
+
+    async def acquire(self, auth_token, priority=config.bc_interactive_priority):
+        bucket = self._buckets.get(auth_token)
+        if not bucket:
+            bucket = self._buckets[auth_token] = _TokenBucket(self.rate, self.burst)
+
+        bucket.refill()
+        if not bucket.waiters and bucket.tokens >= 1:
+            bucket.tokens -= 1
+            return
+
+        future = asyncio.get_event_loop().create_future()
+        heapq.heappush(bucket.waiters, (priority, next(self._seq), future))
+        if not bucket.drainer or bucket.drainer.done():
+            bucket.drainer = asyncio.create_task(self._drain(bucket))
+        await future
+
+    async def _drain(self, bucket):
+        while bucket.waiters:
+            bucket.refill()
+            if bucket.tokens < 1:
+                await asyncio.sleep((1 - bucket.tokens) / bucket.rate)
+                continue
+            future = heapq.heappop(bucket.waiters)[2]
+            if future.done():   # waiter was cancelled
+                continue
+            bucket.tokens -= 1
+            future.set_result(None)
+
+    def queue_depth(self, auth_token=None, priority=None):
+        """Number of requests waiting on the limiter, optionally filtered by auth token and/or priority lane"""
+        buckets = [self._buckets.get(auth_token)] if auth_token else self._buckets.values()
+        depth = 0
+        for bucket in buckets:
+            if not bucket:
+                continue
+            for waiter_priority, _, future in bucket.waiters:
+                if not future.done() and (priority is None or waiter_priority == priority):
+                    depth += 1
+        return depth
+
+
+class BallchasingClient:
+    """Shared async ballchasing client backed by a single keep-alive connection pool"""
+
+    def __init__(self, pool_size=config.bc_pool_size, timeout=config.bc_request_timeout):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._session = None
+        self.limiter = TokenRateLimiter()
+        self._inflight_gets = {}
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                keepalive_timeout=config.bc_keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _build_url(self, endpoint, params=[]):
+        url = config.bc_api_url + endpoint
+        params = '&'.join(params)
+        if params:
+            url += "?{}".format(params)
+        return url
+
+    def _build_form(self, data=None, files=None):
+        form = aiohttp.FormData()
+        for key, value in (data or {}).items():
+            form.add_field(key, str(value))
+        for key, file_obj in files.items():
+            filename = getattr(file_obj, 'name', key)
+            form.add_field(key, file_obj, filename=str(filename).split('/')[-1])
+        return form
+
+    def queue_depth(self, auth_token=None, priority=None):
+        return self.limiter.queue_depth(auth_token, priority)
+
+    async def request(self, method, auth_token, endpoint, params=[], json=None, data=None, files=None, priority=config.bc_interactive_priority):
+        url = self._build_url(endpoint, params)
+        if files:
+            data = self._build_form(data, files)
+
+        # request bodies built from file objects can't be replayed, so only idempotent calls are retried
+        attempts = 1 + (config.bc_max_retries if method in IDEMPOTENT_METHODS else 0)
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            await self.limiter.acquire(auth_token, priority)
+            try:
+                response = await self._send(method, url, auth_token, json=json, data=data)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if last_attempt:
+                    raise
+                await asyncio.sleep(self._backoff_delay(attempt))
+                continue
+
+            if response.status_code not in RETRY_STATUS_CODES or last_attempt:
+                return response
+            await asyncio.sleep(self._backoff_delay(attempt, response.headers.get('Retry-After')))
+
+    async def _send(self, method, url, auth_token, json=None, data=None):
+        session = self._get_session()
+        async with session.request(method, url, headers={'Authorization': auth_token}, json=json, data=data) as r:
+            content = await r.read()
+            return BCResponse(r.status, r.headers, content)
+
+    def _backoff_delay(self, attempt, retry_after=None):
+        """Exponential backoff with full jitter. A Retry-After header, when provided, takes precedence."""
+        if retry_after:
+            try:
+                return min(float(retry_after), config.bc_retry_max_delay)
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    wait = (retry_at - datetime.now(timezone.utc)).total_seconds()
+                    return min(max(wait, 0), config.bc_retry_max_delay)
+                except (TypeError, ValueError):
+                    pass
+        ceiling = min(config.bc_retry_max_delay, config.bc_retry_base_delay * 2 ** attempt)
+        return random.uniform(0, ceiling)
+
+    async def transfer_replay(self, source_token, replay_id, dest_token, params=[], priority=config.bc_interactive_priority):
+        """Streams a replay file from ballchasing straight into a /v2/upload request, without buffering the file.
+        The download is retried like an idempotent request; the upload is not.
+        Returns the upload response, or the download response if the file could not be downloaded."""
+        session = self._get_session()
+        download_url = self._build_url('/replays/{}/file'.format(replay_id))
+        attempts = 1 + config.bc_max_retries
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            # the upload is paced before the download is opened, so the stream doesn't sit idle waiting on the limiter
+            await self.limiter.acquire(dest_token, priority)
+            await self.limiter.acquire(source_token, priority)
+            uploading = False
+            try:
+                async with session.get(download_url, headers={'Authorization': source_token}) as download:
+                    if download.status != 200:
+                        if download.status not in RETRY_STATUS_CODES or last_attempt:
+                            return BCResponse(download.status, download.headers, await download.read())
+                        retry_after = download.headers.get('Retry-After')
+                    else:
+                        with aiohttp.MultipartWriter('form-data') as form:
+                            replay_file = AsyncIterablePayload(download.content.iter_chunked(config.bc_transfer_chunk_size))
+                            part = form.append(replay_file)
+                            part.set_content_disposition('form-data', name='file', filename='{}.replay'.format(replay_id))
+
+                        uploading = True
+                        return await self._send('POST', self._build_url('/v2/upload', params), dest_token, data=form)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if uploading or last_attempt:
+                    raise
+                retry_after = None
+            await asyncio.sleep(self._backoff_delay(attempt, retry_after))
+
+    async def transfer_replays(self, source_token, replay_ids, dest_token, params=[], priority=config.bc_interactive_priority):
+        """Transfers replays concurrently (up to bc_transfer_concurrency at a time).
+        Returns the upload responses in the same order as replay_ids, with None for transfers that failed to connect."""
+        semaphore = asyncio.Semaphore(config.bc_transfer_concurrency)
+
+        async def transfer(replay_id):
+            async with semaphore:
+                try:
+                    return await self.transfer_replay(source_token, replay_id, dest_token, params, priority)
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    return None
+
+        return await asyncio.gather(*[transfer(replay_id) for replay_id in replay_ids])
+
+    async def get(self, auth_token, endpoint, params=[], priority=config.bc_interactive_priority):
+        """Identical GETs (same auth token, endpoint, params and priority) that are already in flight share one request.
+        Priority is part of the key so an interactive caller never waits in the background lane behind a job's request."""
+        key = (auth_token, endpoint, tuple(sorted(params)), priority)
+        task = self._inflight_gets.get(key)
+        if not task:
+            task = asyncio.ensure_future(self.request('GET', auth_token, endpoint, params, priority=priority))
+            self._inflight_gets[key] = task
+            task.add_done_callback(lambda done: self._forget_inflight_get(key, done))
+        # shielded so one caller giving up doesn't cancel the request for everyone else
+        return await asyncio.shield(task)
+
+    def _forget_inflight_get(self, key, task):
+        if self._inflight_gets.get(key) is task:
+            del self._inflight_gets[key]
+
+    async def post(self, auth_token, endpoint, params=[], json=None, data=None, files=None, priority=config.bc_interactive_priority):
+        return await self.request('POST', auth_token, endpoint, params, json=json, data=data, files=files, priority=priority)
+
+    async def patch(self, auth_token, endpoint, params=[], json=None, data=None, priority=config.bc_interactive_priority):
+        return await self.request('PATCH', auth_token, endpoint, params, json=json, data=data, priority=priority)
+
+    async def delete(self, auth_token, endpoint, params=[], priority=config.bc_interactive_priority):
+        return await self.request('DELETE', auth_token, endpoint, params, priority=priority)
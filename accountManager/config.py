@@ -9,6 +9,29 @@ class config:
     team_identification = 'by-distinct-players'                  # setting -- Alternative: 'by-player-clusters'
     player_identification = 'by-id'                             # setting -- Alternative 'by-name'
     top_level_group = "hut-mans-test-dr0mge20kx"
+
+    # Shared ballchasing client
+    bc_api_url = 'https://ballchasing.com/api'
+    bc_pool_size = 20                                           # max open connections to ballchasing
+    bc_keepalive_timeout = 60                                   # seconds an idle connection is kept open
+    bc_request_timeout = 120                                    # seconds
+    bc_rate_limit = 2                                           # requests per second, per auth token
+    bc_rate_burst = 4
+    bc_interactive_priority = 0                                 # commands a member is waiting on
+    bc_background_priority = 10                                 # long running jobs (group copies, etc.)
+    bc_max_retries = 3                                          # retries for idempotent requests (GET, DELETE)
+    bc_retry_base_delay = 1                                     # seconds, doubled each retry
+    bc_retry_max_delay = 30                                     # seconds
+    bc_transfer_concurrency = 3                                 # replays streamed from download to upload at once
+    bc_transfer_chunk_size = 64*1024                            # bytes
+
+    # Background jobs
+    jobs_max_concurrent = 6                                     # jobs running at once across all guilds
+    jobs_max_per_guild = 2                                      # jobs running at once in one guild
+    jobs_history = 20                                           # finished jobs kept for the jobs command
+
+    # Status messages
+    progress_interval = 1.5                                     # seconds between edits of a progress message
     
 # account_register = {
 #     606888593817862144: [["steam", "76561199096013422"]],                 # RSCBot : uploads
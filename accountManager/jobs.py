@@ -0,0 +1,125 @@
+from .config import config
+import traceback
+import itertools
+import asyncio
+import time
+
+
+class Job:
+    def __init__(self, job_id, guild_id, name, key, func, args, owner_id=None, guild_limited=True):
+        self.id = job_id
+        self.guild_id = guild_id
+        self.guild_limited = guild_limited     # counts toward (and waits on) the per-guild limit
+        self.name = name
+        self.key = key
+        self.owner_id = owner_id
+        self.status = 'queued'      # queued, running, done, failed, cancelled
+        self.created = time.monotonic()
+        self.started = None
+        self.finished = None
+        self.task = None
+        self._func = func
+        self._args = args
+
+    @property
+    def active(self):
+        return self.status in ['queued', 'running']
+
+    def age(self):
+        """Seconds the job has been running, or waiting if it hasn't started"""
+        return (self.finished or time.monotonic()) - (self.started or self.created)
+
+
+class JobScheduler:
+    """Runs long running cog commands as background jobs.
+    Jobs start in submission order, without exceeding the global or per-guild concurrency limits.
+    Submitting a job with the same key as a queued or running job returns the existing job instead.
+    """
+
+    def __init__(self, max_jobs=config.jobs_max_concurrent, max_guild_jobs=config.jobs_max_per_guild):
+        self.max_jobs = max_jobs
+        self.max_guild_jobs = max_guild_jobs
+        self._ids = itertools.count(1)
+        self._queued = []
+        self._running = {}      # job id -> job
+        self._finished = []     # most recently finished jobs, newest last
+
+    def submit(self, guild_id, name, key, func, *args, owner_id=None, guild_limited=True):
+        """Queues func(*args) as a job. Returns (job, created) where created is False for a duplicate of an active job.
+        Jobs submitted with guild_limited=False (i.e. background maintenance) are only subject to the global limit."""
+        for job in self._queued + list(self._running.values()):
+            if job.key == key:
+                return job, False
+
+        job = Job(next(self._ids), guild_id, name, key, func, args, owner_id, guild_limited)
+        self._queued.append(job)
+        self._pump()
+        return job, True
+
+    def cancel(self, job_id):
+        """Cancels a queued or running job. Returns the job, or None if no active job has that id."""
+        for job in self._queued:
+            if job.id == job_id:
+                self._queued.remove(job)
+                self._finish(job, 'cancelled')
+                self._pump()
+                return job
+        job = self._running.get(job_id)
+        if job:
+            job.task.cancel()
+        return job
+
+    def cancel_all(self):
+        for job in self._queued:
+            self._finish(job, 'cancelled')
+        self._queued = []
+        for job in self._running.values():
+            job.task.cancel()
+
+    def get(self, job_id):
+        for job in self.jobs():
+            if job.id == job_id:
+                return job
+        return None
+
+    def jobs(self, guild_id=None):
+        """Running, queued, then recently finished jobs, optionally for one guild"""
+        jobs = list(self._running.values()) + self._queued + self._finished[::-1]
+        if guild_id is None:
+            return jobs
+        return [job for job in jobs if job.guild_id == guild_id]
+
+    def _pump(self):
+        for job in list(self._queued):
+            if len(self._running) >= self.max_jobs:
+                return
+            guild_jobs = [running for running in self._running.values() if running.guild_id == job.guild_id and running.guild_limited]
+            if job.guild_limited and len(guild_jobs) >= self.max_guild_jobs:
+                continue
+            self._queued.remove(job)
+            self._start(job)
+
+    def _start(self, job):
+        job.status = 'running'
+        job.started = time.monotonic()
+        self._running[job.id] = job
+        job.task = asyncio.create_task(job._func(*job._args))
+        job.task.add_done_callback(lambda task: self._on_job_done(job, task))
+
+    def _on_job_done(self, job, task):
+        self._running.pop(job.id, None)
+        if task.cancelled():
+            self._finish(job, 'cancelled')
+        elif task.exception():
+            traceback.print_exception(type(task.exception()), task.exception(), task.exception().__traceback__)
+            self._finish(job, 'failed')
+        else:
+            self._finish(job, 'done')
+        self._pump()
+
+    def _finish(self, job, status):
+        job.status = status
+        job.finished = time.monotonic()
+        job._args = None
+        self._finished.append(job)
+        self._finished = self._finished[-config.jobs_history:]
@@ -0,0 +1,48 @@
+from .config import config
+import discord
+import asyncio
+import time
+
+
+class ProgressReporter:
+    """Debounces edits to a status message.
+
+    update() merges the new edit into any pending one and returns immediately; pending edits are flushed at most once
+    every `interval` seconds. finish() always applies the final state, after any edit already in flight.
+    """
+
+    def __init__(self, message, interval=config.progress_interval):
+        self.message = message
+        self.interval = interval
+        self._pending = {}
+        self._last_flush = 0
+        self._timer = None
+        self._lock = asyncio.Lock()
+
+    def update(self, **edit_kwargs):
+        self._pending.update(edit_kwargs)
+        if not self._timer or self._timer.done():
+            delay = max(0, self._last_flush + self.interval - time.monotonic())
+            self._timer = asyncio.create_task(self._flush_after(delay))
+
+    async def finish(self, **edit_kwargs):
+        self._pending.update(edit_kwargs)
+        if self._timer and not self._timer.done():
+            self._timer.cancel()
+        await self._flush()
+
+    async def _flush_after(self, delay):
+        await asyncio.sleep(delay)
+        # shielded so finish() can't drop an edit that is already being sent
+        await asyncio.shield(self._flush())
+
+    async def _flush(self):
+        async with self._lock:
+            if not self._pending:
+                return
+            edit_kwargs, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+            try:
+                await self.message.edit(**edit_kwargs)
+            except discord.HTTPException:
+                pass
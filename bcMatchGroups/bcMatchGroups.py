@@ -2,15 +2,19 @@ import abc
 from distutils.command.config import config
 
 from .bc_config import bcConfig
-from accountManager import AccountManager
+from .group_cache import GroupTreeCache
+from .match_calendar import MatchCalendar
+from .team_index import TeamRoleIndex
+from accountManager import AccountManager, ProgressReporter
 
 from dislash import InteractionClient, ActionRow, Button, ButtonStyle
 from datetime import date, datetime, timedelta, timezone
-import tempfile
 import discord
 import asyncio
-import requests
 import random
+import heapq
+import pytz
+import re
 import urllib.parse
 import traceback
 
@@ -22,7 +26,8 @@ from redbot.core.utils.menus import start_adding_reactions
 
 defaults = {"Emoji": None, "MatchDates": [], "MatchDay": 1,
             "TeamRoles": [], "ReplayGroups": {}, "Schedule": {}, 
-            "TeamNameChanges": {}, "TimeZone": None}
+            "TeamNameChanges": {}, "TimeZone": None, "MatchResults": {},
+            "GroupCopies": {}}
 
 global_defaults = {"BCTokens": {}}
 verify_timeout = 30 # seconds
@@ -38,14 +43,26 @@ class BCMatchGroups(commands.Cog):
         self.config.register_global(**global_defaults)
         self.config.register_guild(**defaults)
         self.account_manager_cog: AccountManager = bot.get_cog("AccountManager")
+        self.group_tree_cache = GroupTreeCache()
+        self.series_outcomes = {}   # (match group code, team role id) -> (replay ids, (wins, losses))
+        self.platform_team_indexes = {}     # guild id -> (account register version, {"platform:id": {team role id, ...}})
+        self.group_copies = {}      # mirror group code -> state of a group copy in progress
+        self.match_calendars = {}   # guild id -> MatchCalendar
+        self.team_role_indexes = {}     # guild id -> TeamRoleIndex
+        self.match_day_schedule = []        # min-heap of (next rollover timestamp, guild id)
+        self.match_day_rollovers = {}       # guild id -> next rollover timestamp (heap entries that don't match are stale)
+        self.match_day_schedule_changed = asyncio.Event()
         self.task = asyncio.create_task(self.auto_update_match_day())
+        self.results_task = asyncio.create_task(self.reconcile_match_results())
         self.auto_update_md = True
 
     def cog_unload(self):
         """Clean up when cog shuts down."""
-        self.auto_update_match_day = False
+        self.auto_update_md = False
         if self.task:
             self.task.cancel()
+        if self.results_task:
+            self.results_task.cancel()
 
 # Admin Commands - Season Configuration
     @commands.command()
@@ -71,8 +88,7 @@ class BCMatchGroups(commands.Cog):
                 return await ctx.send(":x: **{}** is not represented in a valid date format. Use `{}help setMatchDates` for more information.".format(date, ctx.prefix))
 
         all_dates.sort()
-        all_str_dates = [
-            "{dt.month}/{dt.day}/{dt.year}".format(dt=date) for date in all_dates]
+        all_str_dates = [MatchCalendar.format_date(date) for date in all_dates]
         await self._save_match_dates(ctx.guild, all_str_dates)
         await ctx.send(":white_check_mark: Saved {} match dates.".format(len(all_dates)))
 
@@ -132,6 +148,19 @@ class BCMatchGroups(commands.Cog):
         match_day = await self.config.guild(ctx.guild).MatchDay()
         await ctx.send("Match Day {}.".format(match_day))
 
+    @commands.command(aliases=['setMatchTZ'])
+    @commands.guild_only()
+    @checks.admin_or_permissions(manage_guild=True)
+    async def setMatchTimeZone(self, ctx, time_zone):
+        """Sets the time zone match dates are played in. Valid time zone codes are listed in the "TZ database name" column of
+         the following wikipedia page: https://en.wikipedia.org/wiki/List_of_tz_database_time_zones"""
+        if time_zone not in pytz.all_timezones_set:
+            wiki = 'https://en.wikipedia.org/wiki/List_of_tz_database_time_zones'
+            return await ctx.send(":x: **{}** is not a valid time zone code. Please select a time zone from the \"TZ database name\" column from this wikipedia page: {}".format(time_zone, wiki))
+        await self._save_time_zone(ctx.guild, time_zone)
+        await self._schedule_match_day_update(ctx.guild)
+        await ctx.send(":white_check_mark: Match time zone set to **{}**.".format(time_zone))
+
     @commands.command(aliases=['endseason'])
     @commands.guild_only()
     @checks.admin_or_permissions(manage_roles=True)
@@ -140,6 +169,8 @@ class BCMatchGroups(commands.Cog):
         if_not_prompt = "No changes have been made to the current season."
         if await self._react_prompt(ctx, prompt, if_not_prompt):
             await self._save_top_level_groups(ctx.guild, {})
+            await self._clear_stored_results(ctx.guild)
+            self.group_tree_cache.invalidate()
             await self._save_match_day(ctx.guild, 0)
             await self._save_match_dates(ctx.guild, [])
             await ctx.send("Done")
@@ -221,7 +252,7 @@ class BCMatchGroups(commands.Cog):
         removed = 0
         team_roles = await self._get_team_roles(ctx.guild)
         for role in team_roles:
-            for member in role.members:
+            for member in await self._get_roster(role):
                 await member.remove_roles(role)
                 removed += 1
         await ctx.send("Removed team roles for {} players.".format(removed))
@@ -413,15 +444,18 @@ class BCMatchGroups(commands.Cog):
     @commands.guild_only()
     async def listFranchiseTeams(self, ctx):
         """List all registered teams"""
-        member = ctx.message.author
         team_roles = await self._get_team_roles(ctx.guild)
-        await ctx.send('Teams: {}'.format(', '.join(role.mention for role in team_roles)))
+        if not team_roles:
+            return await ctx.send(":x: No teams have been registered.")
+        embeds = self._paginate_lines("Franchise Teams", [role.mention for role in team_roles], discord.Color.green())
+        await self._send_embeds(ctx, embeds)
 
     @commands.command()
     @commands.guild_only()
     async def rosters(self, ctx):
         emoji_url = ctx.guild.icon_url
         team_roles = await self._get_team_roles(ctx.guild)
+        embeds = []
         for team_role in team_roles:
             team_name = self._get_team_name(team_role)
             players = []
@@ -437,8 +471,9 @@ class BCMatchGroups(commands.Cog):
             )
             if emoji_url:
                 embed.set_thumbnail(url=emoji_url)
+            embeds.append(embed)
 
-            await ctx.send(embed=embed)
+        await self._send_embeds(ctx, embeds)
 
     @commands.command(aliases=['seasonGroup', 'myGroup', 'mygroup', 'gsg'])
     @commands.guild_only()
@@ -465,20 +500,21 @@ class BCMatchGroups(commands.Cog):
     async def getSeasonGroups(self, ctx):
         team_roles = await self._get_team_roles(ctx.guild)
 
-        embed = discord.Embed(
-            title="Franchise Ballchasing Groups", color=discord.Color.green())
+        fields = []
         for team_role in team_roles:
             try:
                 group_code = (await self._get_top_level_group(ctx.guild, team_role))[1]
-                embed.add_field(name=team_role.name, value="https://ballchasing.com/group/{}".format(group_code), inline=False)
+                fields.append((team_role.name, "https://ballchasing.com/group/{}".format(group_code)))
             except:
                 pass
 
+        embeds = self._paginate_fields("Franchise Ballchasing Groups", fields, discord.Color.green())
         emoji_url = ctx.guild.icon_url
         if emoji_url:
-            embed.set_thumbnail(url=emoji_url)
+            for embed in embeds:
+                embed.set_thumbnail(url=emoji_url)
 
-        await ctx.send(embed=embed)
+        await self._send_embeds(ctx, embeds)
 
     @commands.command(aliases=['getmatch'])
     @commands.guild_only()
@@ -570,14 +606,27 @@ class BCMatchGroups(commands.Cog):
     @commands.guild_only()
     async def matchDaySummary(self, ctx, match_day=None, team=None):
         """Returns Franchise performance for the current, or provided match day"""
-        asyncio.create_task(self._match_day_summary(ctx, match_day))
+        # resolve the match day first so "mds", "mds <current day>", "mds 3", and "mds 03" share one job
+        if match_day == 'last':
+            match_day = await self._get_match_day(ctx.guild) - 1
+        elif not match_day:
+            match_day = await self._get_match_day(ctx.guild)
+        else:
+            try:
+                match_day = int(match_day)
+            except ValueError:
+                return await ctx.send(":x: **{}** is not a match day.".format(match_day))
+
+        key = ('matchDaySummary', ctx.guild.id, match_day)
+        await self._submit_job(ctx, 'matchDaySummary', key, self._match_day_summary, ctx, match_day)
 
     # TODO: add 'franchise' as team name -- use /groups/{id} on regular season to get team record summary
     @commands.command(aliases=['gsp', 'getSeasonResults', 'gsr'])
     @commands.guild_only()
     async def getSeasonPerformance(self, ctx, *, team_name=None):
         """Returns the season performance for the given team (invoker's team by default)"""
-        asyncio.create_task(self._get_season_performance(ctx, team_name))
+        key = ('getSeasonPerformance', ctx.guild.id, team_name.lower() if team_name else ctx.author.id)
+        await self._submit_job(ctx, 'getSeasonPerformance', key, self._get_season_performance, ctx, team_name)
     # endregion performance
 
     # region action
@@ -586,74 +635,169 @@ class BCMatchGroups(commands.Cog):
     async def copyGroup(self, ctx, team_name, parent_group_code=None):
         """Executes a process to create a copy of a specified team's replay group, and
         saves it to the invoker's ballchasing account. This is a deep copy."""
-        asyncio.create_task(self._process_group_copy(
-            ctx, team_name, parent_group_code))
+        key = ('copyGroup', ctx.guild.id, ctx.author.id, team_name.lower(), parent_group_code)
+        await self._submit_job(ctx, 'copyGroup', key, self._process_group_copy, ctx, team_name, parent_group_code)
+
+    @commands.command(aliases=['copyStatus'])
+    @commands.guild_only()
+    async def groupCopyStatus(self, ctx):
+        """Lists group copies in this guild that are running or can be resumed with copyGroup"""
+        group_copies = await self._get_group_copies(ctx.guild)
+        group_copies.update({mirror: state for mirror, state in self.group_copies.items() if mirror in group_copies})
+        if not group_copies:
+            return await ctx.send("No group copies in progress.")
+
+        lines = []
+        for mirror, copy_state in group_copies.items():
+            planned, done, failed = self._get_group_copy_counts(copy_state)
+            team_role = ctx.guild.get_role(copy_state['team'])
+            team_name = self._get_team_name(team_role) if team_role else "Unknown team"
+            status = "running" if mirror in self.group_copies else "paused"
+            if not copy_state['planned']:
+                lines.append("**{}** -> `{}`: planning ({})".format(team_name, mirror, status))
+            else:
+                lines.append("**{}** -> `{}`: {}/{} done, {} failed ({})".format(team_name, mirror, done, planned, failed, status))
+        await ctx.send("\n".join(lines))
 
     # endregion action
+# Listeners
+    @commands.Cog.listener("on_guild_role_update")
+    async def on_guild_role_update(self, before, after):
+        team_role_index = self.team_role_indexes.get(after.guild.id)
+        if team_role_index and after.id in team_role_index.role_ids and (before.name != after.name or before.position != after.position):
+            self.team_role_indexes.pop(after.guild.id, None)
+
+    @commands.Cog.listener("on_guild_role_delete")
+    async def on_guild_role_delete(self, role):
+        team_role_index = self.team_role_indexes.get(role.guild.id)
+        if team_role_index and role.id in team_role_index.role_ids:
+            self.team_role_indexes.pop(role.guild.id, None)
+
+    @commands.Cog.listener("on_guild_join")
+    async def on_guild_join(self, guild):
+        await self._schedule_match_day_update(guild)
+
+    @commands.Cog.listener("on_member_update")
+    async def on_member_update(self, before, after):
+        if before.roles == after.roles:
+            return
+        changed_role_ids = set(role.id for role in before.roles) ^ set(role.id for role in after.roles)
+        team_role_index = await self._get_team_role_index(after.guild)
+        if changed_role_ids & team_role_index.role_ids:
+            self.platform_team_indexes.pop(after.guild.id, None)
+            team_role_index.update_member(before, after)
+
+    @commands.Cog.listener("on_member_remove")
+    async def on_member_remove(self, member):
+        team_role_index = self.team_role_indexes.get(member.guild.id)
+        if team_role_index:
+            team_role_index.remove_member(member)
+
 # ballchasing functions
-    # references:
-    # https://stackoverflow.com/questions/22190403/how-could-i-use-requests-in-asyncio
-    # https://stackoverflow.com/questions/53368203/passing-args-kwargs-to-run-in-executor/53369236
-
-    async def _bc_delete_request(self, auth_token, endpoint, params=[]):
-        url = 'https://ballchasing.com/api'
-        url += endpoint
-        # params = [urllib.parse.quote(p) for p in params]
-        params = '&'.join(params)
-        if params:
-            url += "?{}".format(params)
-
-        # url = urllib.parse.quote_plus(url)
-        loop = asyncio.get_event_loop()
-        future = loop.run_in_executor(None, lambda: requests.delete(
-            url, headers={'Authorization': auth_token}))
-        response = await future
-        return response
-
-    async def _bc_get_request(self, auth_token, endpoint, params=[]):
-        url = 'https://ballchasing.com/api'
-        url += endpoint
-        # params = [urllib.parse.quote(p) for p in params]
-        params = '&'.join(params)
-        if params:
-            url += "?{}".format(params)
-
-        # url = urllib.parse.quote_plus(url)
-        loop = asyncio.get_event_loop()
-        future = loop.run_in_executor(None, lambda: requests.get(
-            url, headers={'Authorization': auth_token}))
-        response = await future
-        return response
-
-    async def _bc_post_request(self, auth_token, endpoint, params=[], json=None, data=None, files=None):
-        url = 'https://ballchasing.com/api'
-        url += endpoint
-        params = '&'.join(params)
-        if params:
-            url += "?{}".format(params)
-
-        # return requests.post(url, headers={'Authorization': auth_token}, json=json, data=data, files=files)
-        loop = asyncio.get_event_loop()
-        future = loop.run_in_executor(None, lambda: requests.post(
-            url, headers={'Authorization': auth_token}, json=json, data=data, files=files))
-        response = await future
-        return response
-
-    async def _bc_patch_request(self, auth_token, endpoint, params=[], json=None, data=None):
-        url = 'https://ballchasing.com/api'
-        url += endpoint
-        params = '&'.join(params)
-        if params:
-            url += "?{}".format(params)
-
-        # return requests.patch(url, headers={'Authorization': auth_token}, json=json, data=data)
-        loop = asyncio.get_event_loop()
-        future = loop.run_in_executor(None, lambda: requests.patch(
-            url, headers={'Authorization': auth_token}, json=json, data=data))
-        response = await future
-        return response
+    # requests are routed through the accountManager's shared ballchasing client
+
+    async def _bc_delete_request(self, auth_token, endpoint, params=[], priority=bcConfig.INTERACTIVE_PRIORITY):
+        return await self.account_manager_cog.bc_delete_request(auth_token, endpoint, params, priority=priority)
+
+    async def _bc_get_request(self, auth_token, endpoint, params=[], priority=bcConfig.INTERACTIVE_PRIORITY):
+        return await self.account_manager_cog.bc_get_request(auth_token, endpoint, params, priority=priority)
+
+    async def _bc_post_request(self, auth_token, endpoint, params=[], json=None, data=None, files=None, priority=bcConfig.INTERACTIVE_PRIORITY):
+        return await self.account_manager_cog.bc_post_request(auth_token, endpoint, params, json=json, data=data, files=files, priority=priority)
+
+    async def _bc_patch_request(self, auth_token, endpoint, params=[], json=None, data=None, priority=bcConfig.INTERACTIVE_PRIORITY):
+        return await self.account_manager_cog.bc_patch_request(auth_token, endpoint, params, json=json, data=data, priority=priority)
+
+    async def _bc_get_all_pages(self, auth_token, endpoint, params=[], priority=bcConfig.INTERACTIVE_PRIORITY):
+        """Lists every entry of a paginated /groups or /replays listing by following its `next` links.
+        Returns None if any page could not be retrieved."""
+        entries = []
+        while True:
+            r = await self._bc_get_request(auth_token, endpoint, params=params, priority=priority)
+            if r.status_code != 200:
+                return None
+            data = r.json()
+            entries.extend(data.get('list', []))
+            if not data.get('next'):
+                return entries
+            # `next` is a full url to the same endpoint, carrying the paging cursor in its query string
+            params = urllib.parse.urlparse(data['next']).query.split('&')
 
 # other functions
+    async def _submit_job(self, ctx, name, key, func, *args):
+        """Runs a long running command as an accountManager background job"""
+        job, created = self.account_manager_cog.submit_job(ctx.guild, name, key, func, *args, owner=ctx.author)
+        if not created:
+            await ctx.send(":x: This request is already {} (job `{}`). Use `{}jobs` to see its status.".format(job.status, job.id, ctx.prefix))
+        elif job.status == 'queued':
+            await ctx.send("Your request is queued as job `{}` and will start when a slot frees up. Use `{}jobs` to see its status.".format(job.id, ctx.prefix))
+
+    # output
+    async def _send_embeds(self, ctx, embeds):
+        """Sends embeds in as few messages as possible, up to EMBEDS_PER_MESSAGE per message. Where discord.py
+        can't send several embeds in one message, each batch is packed into as few embeds as the embed limits allow."""
+        for i in range(0, len(embeds), bcConfig.EMBEDS_PER_MESSAGE):
+            batch = embeds[i:i+bcConfig.EMBEDS_PER_MESSAGE]
+            if discord.version_info.major >= 2:
+                await ctx.send(embeds=batch)
+            else:
+                for embed in self._pack_embeds(batch):
+                    if embed.fields or embed.description:
+                        await ctx.send(embed=embed)
+
+    def _pack_embeds(self, embeds):
+        """Merges embeds into fields of shared embeds, keeping each under discord's field and size limits"""
+        if len(embeds) == 1:
+            if not embeds[0].description and not embeds[0].fields:
+                embeds[0].description = '-'
+            return embeds
+
+        fields = []
+        for embed in embeds:
+            if embed.description or not embed.fields:
+                # empty embeds (i.e. a team without players) still get a field
+                fields.append((embed.title, embed.description or '-'))
+            fields.extend((field.name, field.value) for field in embed.fields)
+        if not fields:
+            return []
+
+        packed = self._paginate_fields(None, fields, embeds[0].color, inline=True)
+        if embeds[0].thumbnail:
+            for embed in packed:
+                embed.set_thumbnail(url=embeds[0].thumbnail.url)
+        return packed
+
+    def _paginate_fields(self, title, fields, color, inline=False):
+        """Builds embeds from (name, value) fields, starting a new embed when one would exceed discord's limits"""
+        def new_embed():
+            embed = discord.Embed(color=color)
+            if title:
+                embed.title = title
+            return embed
+
+        embeds = [new_embed()]
+        for name, value in fields:
+            name = str(name)[:bcConfig.EMBED_FIELD_NAME_LIMIT] if name else '-'
+            value = str(value)[:bcConfig.EMBED_FIELD_VALUE_LIMIT] if value else '-'
+            embed = embeds[-1]
+            if len(embed.fields) >= bcConfig.EMBED_FIELD_LIMIT or len(embed) + len(name) + len(value) > bcConfig.EMBED_SIZE_LIMIT:
+                embed = new_embed()
+                embeds.append(embed)
+            embed.add_field(name=name, value=value, inline=inline)
+        return embeds
+
+    def _paginate_lines(self, title, lines, color):
+        """Builds embeds listing lines in their descriptions, starting a new embed when a description would be too long"""
+        pages = [[]]
+        page_size = 0
+        for line in lines:
+            if pages[-1] and page_size + len(line) + 1 > bcConfig.EMBED_DESCRIPTION_LIMIT:
+                pages.append([])
+                page_size = 0
+            pages[-1].append(line)
+            page_size += len(line) + 1
+        return [discord.Embed(title=title, description='\n'.join(page), color=color) for page in pages]
+
     # big helpers
 
     async def _process_group_copy(self, ctx, team_name, parent_code=None, status_msg=None):
@@ -662,118 +806,258 @@ class BCMatchGroups(commands.Cog):
         # Get origin replay group
         initial_update = "Embed: Matching to team replay group..."
         if status_msg:
-            await status_msg.edit(content=initial_update)
+            progress = ProgressReporter(status_msg)
+            progress.update(content=initial_update)
         else:
-            status_msg = await ctx.send(initial_update)
+            progress = ProgressReporter(await ctx.send(initial_update))
         team_role = await self._match_team_role(ctx.guild, member, team_name)
         if not team_role:
-            return await ctx.send(":x: Team not found.")
+            return await progress.finish(content=":x: Team not found.")
         team_name = self._get_team_name(team_role)
 
-        top_level_group = (await self._get_top_level_group(ctx.guild, team_role))[1]
+        top_level_group = await self._get_top_level_group(ctx.guild, team_role)
+        if not top_level_group:
+            return await progress.finish(content=":x: **{}** does not have a ballchasing group.".format(team_name))
+        top_level_group = top_level_group[1]
 
-        await ctx.send('top group: {}'.format(top_level_group))
         # Verify Group Can be Copied to Destination
-        await status_msg.edit(content="Embed: Verifying valid destination...")
+        progress.update(content="Embed: Verifying valid destination...")
         auth_token = await self._get_member_bc_token(member)
         if not auth_token:
-            await status_msg.edit(content="Embed: :x: Member has not registered a ballchasing auth token.")
+            await progress.finish(content="Embed: :x: Member has not registered a ballchasing auth token.")
             return
 
-        # Initiate copy process
-        # status_msg = await status_msg.edit(content="Embed: Preparing to copy groups...")
+        # Resume an unfinished copy of this group, if there is one
+        copy_state = await self._find_group_copy(ctx.guild, member, top_level_group, parent_code)
+        if copy_state:
+            planned, done, failed = self._get_group_copy_counts(copy_state)
+            progress.update(content="Embed: Resuming copy of **{}** ({}/{} done)...".format(team_name, done, planned))
+            return await self._run_group_copy(ctx, auth_token, copy_state, progress)
 
-        await ctx.send("A")
         # TODO: make top_level_group IN parent_code instead of them being topographically equal
         if parent_code:
-            r = await self._bc_get_request(auth_token, '/groups{}'.format(parent_code))
+            r = await self._bc_get_request(auth_token, '/groups/{}'.format(parent_code))
             if r.status_code != 200:
-                return await status_msg.edit(content=":x: **{}** is not a valid ballchasing group code.".format(parent_code))
+                return await progress.finish(content=":x: **{}** is not a valid ballchasing group code.".format(parent_code))
         else:
             r = await self._bc_get_request(auth_token, '/groups/{}'.format(top_level_group))
             if r.status_code != 200:
-                return await status_msg.edit(content=":x: Error copying season group.")
+                return await progress.finish(content=":x: Error copying season group.")
             data = r.json()
             payload = {
                 "name": "Copy of {}".format(data['name']),
-                "player_identification": data["by-id"],
-                "team_identification": data["by-distinct-players"]
+                "player_identification": data["player_identification"],
+                "team_identification": data["team_identification"]
             }
-            r = await self._bc_post_request(auth_token, '/groups', data=payload)
+            r = await self._bc_post_request(auth_token, '/groups', json=payload)
             if r.status_code == 201:
                 data = r.json()
                 parent_code = data['id']
             else:
-                return await status_msg.edit(content=":x: Error copying season group.")
+                return await progress.finish(content=":x: Error copying season group.")
 
-        await ctx.send("B")
         # Perform Copy
-        await self._perform_recursive_copy(auth_token, top_level_group, parent_code)
-
-    async def _perform_recursive_copy(self, ctx, auth_token, parent_origin, parent_mirror, wait_time=0):
-        if wait_time:
-            await asyncio.sleep(wait_time)
-
-        copy_params = ['group={}'.format(parent_origin)]
-        mirror_params = ['group={}'.format(parent_mirror)]
-
-        # Step 1: Copy all subgroups in current group
-        # Get existing subgroups
-        r = await self._bc_get_request(auth_token, '/groups', params=copy_params)
-        r_mirror = await self._bc_get_request(auth_token, '/groups', params=mirror_params)
-
-        if r.status_code != 200 or r_mirror.status_code != 200:
-            return
+        copy_state = self._new_group_copy(member, team_role, top_level_group, parent_code)
+        await self._run_group_copy(ctx, auth_token, copy_state, progress)
+
+    def _new_group_copy(self, member, team_role, source_code, mirror_code):
+        return {
+            'owner': member.id,
+            'team': team_role.id,
+            'source': source_code,
+            'mirror': mirror_code,
+            'planned': False,
+            'groups': [],                       # [source id, parent source id, payload] in breadth-first order
+            'replays': [],                      # [replay id, source group id, rocket league match guid]
+            'mirrors': {source_code: mirror_code},  # source group id -> mirror group id
+            'done': [],                         # replay ids copied
+            'failed': []                        # group and replay ids that could not be copied
+        }
 
-        # prepare all subgroup copies
-        data = r.json()
-        mirror_data = r_mirror.json()
-        if data['list']:
-            subgroup_id_payloads = {}
-            for subgroup in data['list']:
-                sub_payload = {
-                    'name': subgroup['name'],
-                    'player_identification': subgroup['player_identification'],
-                    'team_identification': subgroup['team_identification'],
-                    'parent': parent_mirror
-                }
-                subgroup_id_payloads.append({subgroup['id']: sub_payload})
-
-        # Create subgroup copies
-        for subgroup_id, subgroup_payload in subgroup_id_payloads.items():
-            group_exists = False
-            if mirror_data['count'] > 0:
-                for mirror_subgroup in mirror_data['list']:
-                    if subgroup_payload['name'] == mirror_subgroup['name']:
-                        group_exists = True
-                        break
-
-            # If not, create it
-            if not group_exists:
-                r = await self._bc_post_request(auth_token, '/groups', data=subgroup_payload)
+    def _get_group_copy_counts(self, copy_state):
+        """Returns (planned, done, failed) counts for a group copy. Groups and replays each count as one step."""
+        planned = len(copy_state['groups']) + len(copy_state['replays'])
+        done = len(copy_state['mirrors']) - 1 + len(copy_state['done'])
+        return planned, done, len(copy_state['failed'])
+
+    async def _run_group_copy(self, ctx, auth_token, copy_state, progress):
+        """Crawls the source tree (unless already planned), then copies groups level by level and replays with a worker pool.
+        Progress is checkpointed to config so an interrupted copy can be resumed with copyGroup."""
+        self.group_copies[copy_state['mirror']] = copy_state
+        copy_state['failed'] = []   # failures are retried on resume
+        try:
+            if not copy_state['planned']:
+                progress.update(content="Embed: Planning group copy...")
+                if not await self._plan_group_copy(auth_token, copy_state):
+                    await self._save_group_copy(ctx.guild, copy_state)
+                    return await progress.finish(content=":x: Error reading the source group. Run the command again to resume.")
+                await self._save_group_copy(ctx.guild, copy_state)
+
+            await self._copy_planned_groups(ctx.guild, auth_token, copy_state, progress)
+            await self._copy_planned_replays(ctx.guild, auth_token, copy_state, progress)
+        finally:
+            self.group_copies.pop(copy_state['mirror'], None)
+
+        planned, done, failed = self._get_group_copy_counts(copy_state)
+        if failed:
+            await self._save_group_copy(ctx.guild, copy_state)
+            return await progress.finish(content=":x: Copied {}/{} groups and replays, {} failed. Run the command again to retry them.\n<https://ballchasing.com/group/{}>".format(
+                done, planned, failed, copy_state['mirror']))
+        await self._remove_group_copy(ctx.guild, copy_state['mirror'])
+        await progress.finish(content=":white_check_mark: Copied {} groups and replays.\n<https://ballchasing.com/group/{}>".format(done, copy_state['mirror']))
+
+    async def _plan_group_copy(self, auth_token, copy_state):
+        """Breadth-first crawl of the source group. Records every subgroup and replay to copy. Returns False if any listing failed."""
+        semaphore = asyncio.Semaphore(bcConfig.COPY_WORKERS)
+        priority = bcConfig.BACKGROUND_PRIORITY
+
+        async def list_group(group_code):
+            async with semaphore:
+                params = ['group={}'.format(group_code), 'count=200']
+                subgroups = await self._bc_get_all_pages(auth_token, '/groups', params=params, priority=priority)
+                group_replays = await self._bc_get_all_pages(auth_token, '/replays', params=params, priority=priority)
+                if subgroups is None or group_replays is None:
+                    return None
+                return subgroups, group_replays
+
+        groups, replays = [], []
+        level = [copy_state['source']]
+        while level:
+            listings = await asyncio.gather(*[list_group(group_code) for group_code in level])
+            next_level = []
+            for group_code, listing in zip(level, listings):
+                if listing is None:
+                    return False
+                subgroups, group_replays = listing
+                for subgroup in subgroups:
+                    payload = {
+                        'name': subgroup['name'],
+                        'player_identification': subgroup['player_identification'],
+                        'team_identification': subgroup['team_identification']
+                    }
+                    groups.append([subgroup['id'], group_code, payload])
+                    next_level.append(subgroup['id'])
+                replays.extend([replay['id'], group_code, replay.get('rocket_league_id')] for replay in group_replays)
+            level = next_level
+
+        copy_state['groups'] = groups
+        copy_state['replays'] = replays
+        copy_state['planned'] = True
+        return True
+
+    async def _copy_planned_groups(self, guild, auth_token, copy_state, progress):
+        """Creates the mirror groups one tree level at a time, reusing mirror subgroups that already exist by name"""
+        semaphore = asyncio.Semaphore(bcConfig.COPY_WORKERS)
+        priority = bcConfig.BACKGROUND_PRIORITY
+        mirrors = copy_state['mirrors']
+        mirror_listings = {}
+
+        async def copy_group(source_id, parent_id, payload):
+            mirror_parent = mirrors.get(parent_id)
+            if not mirror_parent:
+                copy_state['failed'].append(source_id)
+                return
+            async with semaphore:
+                if mirror_listings.get(mirror_parent) is None:
+                    params = ['group={}'.format(mirror_parent), 'count=200']
+                    mirror_listings[mirror_parent] = await self._bc_get_all_pages(auth_token, '/groups', params=params, priority=priority)
+                if mirror_listings[mirror_parent] is None:
+                    # creating the group blind could duplicate one that already exists, so it's retried on resume
+                    copy_state['failed'].append(source_id)
+                    return
+                for mirror_subgroup in mirror_listings[mirror_parent]:
+                    if mirror_subgroup['name'] == payload['name']:
+                        mirrors[source_id] = mirror_subgroup['id']
+                        return
+
+                r = await self._bc_post_request(auth_token, '/groups', json=dict(payload, parent=mirror_parent), priority=priority)
                 if r.status_code == 201:
-                    data = r.json()
-                    mirror_subgroup_id = data['id']
-
-            # Perform recursive copy
-            await self._perform_recursive_copy(ctx, auth_token, subgroup_id, mirror_subgroup_id, wait_time=10)
-
-        # Step 2: Copy all replays in current group
-        # TODO: patch if original uploader is creating a copy
-        # Get existing replays
-        r = await self._bc_get_request(auth_token, '/replays', params=copy_params)
-        if r.status_code != 200:
-            return
-
-        data = r.json()
-        if data['count']:
-            replay_ids = []
-            for replay in data['list']:
-                replay_ids.append(replay['id'])  # fix
+                    mirrors[source_id] = r.json()['id']
+                else:
+                    copy_state['failed'].append(source_id)
+
+        # groups are planned breadth-first, so each level's parents exist before it is copied
+        pending = [group for group in copy_state['groups'] if group[0] not in mirrors]
+        while pending:
+            level_parents = set(group[1] for group in pending if group[1] in mirrors or group[1] in copy_state['failed'])
+            level = [group for group in pending if group[1] in level_parents]
+            if not level:
+                copy_state['failed'].extend(group[0] for group in pending)
+                break
+            await asyncio.gather(*[copy_group(*group) for group in level])
+            pending = [group for group in pending if group not in level]
+            await self._save_group_copy(guild, copy_state)
+            planned, done, failed = self._get_group_copy_counts(copy_state)
+            progress.update(content="Embed: Copying groups... ({}/{} done, {} failed)".format(done, planned, failed))
+
+    async def _copy_planned_replays(self, guild, auth_token, copy_state, progress):
+        """Copies the planned replays into their mirror groups with a bounded pool of workers.
+        Replays already in their mirror group are marked done without being transferred again."""
+        mirrors = copy_state['mirrors']
+        done = set(copy_state['done'])
+        pending = [replay for replay in copy_state['replays'] if replay[0] not in done]
+        mirror_index = await self._get_mirror_replay_index(auth_token, set(mirrors[replay[1]] for replay in pending if replay[1] in mirrors))
+
+        queue = asyncio.Queue()
+        for replay in pending:
+            replay_id, group_id = replay[:2]
+            match_guid = replay[2] if len(replay) > 2 else None
+            mirrored = mirror_index.get(mirrors.get(group_id), set())
+            if mirrored is None:
+                # the mirror group couldn't be listed, so the replay is retried on resume rather than risk a duplicate
+                copy_state['failed'].append(replay_id)
+            elif replay_id in mirrored or (match_guid and match_guid in mirrored):
+                copy_state['done'].append(replay_id)
+            else:
+                queue.put_nowait((replay_id, group_id, match_guid))
+        completed = 0
+
+        async def worker():
+            nonlocal completed
+            while not queue.empty():
+                replay_id, group_id, match_guid = queue.get_nowait()
+                mirror_id = mirrors.get(group_id)
+                copied = {}
+                if mirror_id:
+                    # never re-parent on a conflict: the existing replay is the source replay when the owner mirrors their own group
+                    mirrored = mirror_index.get(mirror_id) or set()
+                    copied = await self._transfer_replays(auth_token, auth_token, mirror_id, [replay_id], priority=bcConfig.BACKGROUND_PRIORITY,
+                                                          reparent=False, existing_ids=mirrored)
+                if replay_id in copied:
+                    copy_state['done'].append(replay_id)
+                    mirror_index.setdefault(mirror_id, set()).update(key for key in [copied[replay_id], match_guid] if key)
+                else:
+                    copy_state['failed'].append(replay_id)
+
+                completed += 1
+                if completed % bcConfig.COPY_CHECKPOINT_INTERVAL == 0:
+                    await self._save_group_copy(guild, copy_state)
+                    planned, done_count, failed = self._get_group_copy_counts(copy_state)
+                    progress.update(content="Embed: Copying replays... ({}/{} done, {} failed)".format(done_count, planned, failed))
+
+        await asyncio.gather(*[worker() for _ in range(bcConfig.COPY_WORKERS)])
+
+    async def _get_mirror_replay_index(self, auth_token, mirror_ids):
+        """Lists each mirror group's replays once. Returns mirror group id -> set of replay ids and rocket league match guids in it,
+        so a replay uploaded under a new id is still recognized as a duplicate. The set is None if the group couldn't be listed."""
+        semaphore = asyncio.Semaphore(bcConfig.COPY_WORKERS)
+
+        async def index_group(mirror_id):
+            async with semaphore:
+                params = ['group={}'.format(mirror_id), 'count=200']
+                mirror_replays = await self._bc_get_all_pages(auth_token, '/replays', params=params, priority=bcConfig.BACKGROUND_PRIORITY)
+            if mirror_replays is None:
+                return None
+            keys = set()
+            for replay in mirror_replays:
+                keys.add(replay['id'])
+                if replay.get('rocket_league_id'):
+                    keys.add(replay['rocket_league_id'])
+            return keys
 
-            # Copy over replays
-            tmp_replay_files = await self._download_replays(auth_token, replay_ids)
-            uploaded_ids = await self._upload_replays(auth_token, parent_mirror, tmp_replay_files, ctx=ctx)
+        mirror_ids = list(mirror_ids)
+        indexes = await asyncio.gather(*[index_group(mirror_id) for mirror_id in mirror_ids])
+        return dict(zip(mirror_ids, indexes))
 
     async def _get_season_performance(self, ctx, team_name):
         member = ctx.message.author
@@ -806,8 +1090,9 @@ class BCMatchGroups(commands.Cog):
         total_losses = 0
 
         num_match_days = int(await self._get_match_day(ctx.guild))
+        season_results = await self._get_season_results(ctx.guild, team_role, auth_token)
         for match_day in range(1, num_match_days+1):
-            results = await self._get_team_results(ctx, team_name, match_day, auth_token)
+            results = season_results.get(match_day, [(0, 0, '')])
             for result in results:
                 wins, losses, opponent = result
                 total_wins += wins
@@ -887,26 +1172,20 @@ class BCMatchGroups(commands.Cog):
         if emoji_url:
             embed.set_thumbnail(url=emoji_url)
         bc_status_msg = await ctx.send(embed=embed)
+        progress = ProgressReporter(bc_status_msg)
 
         # get match date
-        all_matches = await self._get_match_dates(ctx.guild)
-        now = datetime.now()
-        diff = 1
-        today = "{dt.month}/{dt.day}/{dt.year}".format(dt=now)
-
-        # await ctx.send("num matches: {}".format(len(all_matches)))
-        # await ctx.send("md: {} ({})".format(match_day, type(match_day)))
         # TODO: figure out why this needs to be parsed as an int (only when passed by command)
         if type(match_day) == str:
             match_day = int(match_day)
 
-        if today in all_matches and len(all_matches) >= match_day:
-            match_date = all_matches[match_day - diff]
+        if match_type == bcConfig.REGULAR_SEASON_MT:
+            match_date = (await self._get_match_calendar(ctx.guild)).get_match_date(match_day)
         else:
             match_date = None
 
         if match_type == bcConfig.SCRIM_MT:
-            match_date = today
+            match_date = await self._get_guild_today(ctx.guild)
 
         # Find replays from ballchasing
         match = {
@@ -932,7 +1211,7 @@ class BCMatchGroups(commands.Cog):
             if opposing_team == reported_opposing_team:
                 embed.description = "This match has already been reported.\n\n{}\n\nView Here: {}".format(
                     summary, link)
-                await bc_status_msg.edit(embed=embed)
+                await progress.finish(embed=embed)
                 return
 
         if match_type == "Scrim":
@@ -945,12 +1224,12 @@ class BCMatchGroups(commands.Cog):
         # Not found:
         if not replays_found:
             embed.description = ":x: No matching replays found on ballchasing."
-            await bc_status_msg.edit(embed=embed)
+            await progress.finish(embed=embed)
             return None
             # replay_ids, summary, winner = None, None, None
         else:
             # Found:
-            replay_ids, summary, winner = replays_found
+            replay_ids, summary, winner, uploader_steam_id = replays_found
         # await ctx.send("replays found: {}".format(replays_found))
 
         if winner:
@@ -983,7 +1262,7 @@ class BCMatchGroups(commands.Cog):
                 if type(maybe_new_replays) == bool:
                     pass
                 else:
-                    replay_ids, summary, winner = maybe_new_replays
+                    replay_ids, summary, winner, uploader_steam_id = maybe_new_replays
             else:
                 return False
 
@@ -1001,29 +1280,149 @@ class BCMatchGroups(commands.Cog):
         if not match_subgroup_id:
             return False
 
-        # Download and upload replays
-        tmp_replay_files = await self._download_replays(auth_token, replay_ids)
-        uploaded_ids = await self._upload_replays(owner_auth_token, match_subgroup_id, tmp_replay_files, ctx=ctx)
+        # Replays the group owner already owns are moved into the subgroup, only the rest are copied over
+        owned_ids, foreign_ids = await self._plan_replay_transfers(owner_auth_token, replay_ids, uploader_steam_id)
+        placed_ids = await self._move_replays(owner_auth_token, match_subgroup_id, owned_ids, ctx=ctx)
+        placed_ids.update(await self._transfer_replays(auth_token, owner_auth_token, match_subgroup_id, foreign_ids, ctx=ctx))
+        uploaded_ids = [placed_ids[replay_id] for replay_id in replay_ids[::-1] if replay_id in placed_ids]
         # await ctx.send("replays in subgroup: {}".format(", ".join(uploaded_ids)))
+        embed.description = "Match summary:\n{}\n\n:signal_strength: {}/{} replays added to the group. Naming games...".format(
+            summary, len(uploaded_ids), len(replay_ids))
+        progress.update(embed=embed)
+
+        renamed, rename_failures = await self._rename_replays(owner_auth_token, uploaded_ids)
 
-        renamed = await self._rename_replays(ctx, owner_auth_token, uploaded_ids)
+        # Materialize the reported series so summaries don't need to rebuild it from ballchasing
+        if match_type != bcConfig.SCRIM_MT:
+            # if the group can't be read back right now, reconciling picks the series up later
+            series_record = await self._get_series_record(owner_auth_token, match_subgroup_id, team_role)
+            if series_record:
+                wins, losses, guessed = series_record
+                record = self._get_match_record(match['away'].title(), wins, losses, match_subgroup_id, guessed=guessed, reported=True)
+                await self._save_match_result(ctx.guild, team_role, match_type, match_day, record)
 
         embed.description = "Match summary:\n{}\n\n[View the ballchasing group!](https://ballchasing.com/group/{})\n\n:white_check_mark: Done".format(
             summary, match_subgroup_id)
+        if rename_failures:
+            embed.description += "\n:x: {} replay(s) could not be renamed ({}).".format(
+                len(rename_failures), ", ".join(str(code) for code in sorted(set(rename_failures.values()))))
         # embed.set_thumbnail(url=emoji_url)
-        await bc_status_msg.edit(embed=embed)
+        await progress.finish(embed=embed)
 
-    # standard -- maybe rework so each guild gets a scheduled update based on their time zone
     async def auto_update_match_day(self):
-        """Loop task to auto-update match day"""
+        """Loop task to auto-update match day. Each guild is updated at midnight in its own match time zone."""
         await self.bot.wait_until_ready()
-        # self.bot.get_cog("bcMatchGroups") == self:
+        for guild in self.bot.guilds:
+            await self._update_match_day(guild, force_set=True)
+            await self._schedule_match_day_update(guild)
+
         while self.auto_update_md:
-            for guild in self.bot.guilds:
-                await self._update_match_day(guild, force_set=True)
-                update_time = self._schedule_next_update()
-            await asyncio.sleep(update_time)
+            if not self.match_day_schedule:
+                await self.match_day_schedule_changed.wait()
+                self.match_day_schedule_changed.clear()
+                continue
+
+            rollover, guild_id = self.match_day_schedule[0]
+            wait_time = rollover - datetime.now(timezone.utc).timestamp()
+            if wait_time > 0:
+                # sleep until the earliest rollover, waking early if a guild is rescheduled
+                try:
+                    await asyncio.wait_for(self.match_day_schedule_changed.wait(), timeout=wait_time)
+                except asyncio.TimeoutError:
+                    pass
+                self.match_day_schedule_changed.clear()
+                continue
+
+            heapq.heappop(self.match_day_schedule)
+            if self.match_day_rollovers.get(guild_id) != rollover:
+                continue
+            guild = self.bot.get_guild(guild_id)
+            if not guild:
+                del self.match_day_rollovers[guild_id]
+                continue
+            await self._update_match_day(guild, force_set=True)
+            await self._schedule_match_day_update(guild)
+
+    async def _schedule_match_day_update(self, guild):
+        """(Re)schedules the guild's next match day update for its next local midnight"""
+        rollover = self._get_next_rollover(await self._get_time_zone(guild))
+        self.match_day_rollovers[guild.id] = rollover
+        heapq.heappush(self.match_day_schedule, (rollover, guild.id))
+        self.match_day_schedule_changed.set()
+
+    def _get_next_rollover(self, time_zone):
+        """Timestamp of the next midnight in the time zone (plus 30 seconds of slack)"""
+        tz = pytz.timezone(time_zone)
+        tomorrow = datetime.now(tz).date() + timedelta(days=1)
+        midnight = tz.localize(datetime.combine(tomorrow, datetime.min.time()))
+        return midnight.timestamp() + 30
         
+    async def reconcile_match_results(self):
+        """Loop task to reconcile the stored match results with ballchasing"""
+        await self.bot.wait_until_ready()
+        while True:
+            for guild in self.bot.guilds:
+                for team_role in await self._get_team_roles(guild):
+                    try:
+                        top_level_group = await self._get_top_level_group(guild, team_role)
+                        if not top_level_group:
+                            continue
+                        auth_token = await self._get_member_bc_token(guild.get_member(top_level_group[0]))
+                        if not auth_token:
+                            continue
+                        top_group_code = top_level_group[1]
+                        for match_type in [bcConfig.REGULAR_SEASON_MT, bcConfig.POSTSEASON_MT]:
+                            match_groups = await self._get_match_type_subgroups(auth_token, top_group_code, match_type, priority=bcConfig.BACKGROUND_PRIORITY)
+                            if match_groups is None:
+                                continue
+                            listed_groups = set(match_group['id'] for match_group in match_groups)
+
+                            # series reported through bcReport are kept as they are, unless their group is gone from ballchasing
+                            stored_results = await self._get_stored_results(guild, team_role, match_type)
+                            reported_results = {}
+                            for match_day, records in stored_results.items():
+                                reported = [record for record in records if record.get('reported') and record['group'] in listed_groups]
+                                if reported:
+                                    reported_results[match_day] = reported
+                            reported_groups = [record['group'] for records in reported_results.values() for record in records]
+
+                            results = await self._fetch_season_records(guild, team_role, auth_token, match_type, skip_groups=reported_groups, priority=bcConfig.BACKGROUND_PRIORITY)
+                            if results is not None:
+                                for match_day, records in reported_results.items():
+                                    results.setdefault(match_day, []).extend(records)
+                                await self._save_stored_results(guild, team_role, match_type, results)
+                    except Exception:
+                        traceback.print_exc()
+            await asyncio.sleep(bcConfig.RESULTS_RECONCILE_INTERVAL)
+
+    async def _warm_match_day_caches(self, guild, match_day):
+        """Preloads what the first commands of a new match day need: the roster and platform indexes, and each team's
+        group tree and any existing match groups for the match day. Requests are sent at background priority.
+        The preloaded group listings are kept until the next rollover, so they're still warm by match time."""
+        for team_role in await self._get_team_roles(guild):
+            await self._get_roster(team_role)
+        await self._get_platform_team_index(guild)
+
+        semaphore = asyncio.Semaphore(bcConfig.SUMMARY_CONCURRENCY)
+        next_rollover = self._get_next_rollover(await self._get_time_zone(guild))
+
+        async def warm_team(team_role):
+            top_level_group = await self._get_top_level_group(guild, team_role)
+            if not top_level_group:
+                return
+            auth_token = await self._get_member_bc_token(guild.get_member(top_level_group[0]))
+            if not auth_token:
+                return
+            async with semaphore:
+                try:
+                    await self._get_match_day_records(guild, team_role, match_day, auth_token, priority=bcConfig.BACKGROUND_PRIORITY)
+                except Exception:
+                    traceback.print_exc()
+            # groups made through bcReport are added to the cached listings, so they can be trusted for the day
+            self.group_tree_cache.extend(top_level_group[1], next_rollover - datetime.now(timezone.utc).timestamp())
+
+        await asyncio.gather(*[warm_team(team_role) for team_role in await self._get_team_roles(guild)])
+
     async def _process_team_name_reset(self, guild, team_role):
         """Schedules task to reset team name"""
         await self.bot.wait_until_ready()
@@ -1099,25 +1498,8 @@ class BCMatchGroups(commands.Cog):
 
         ## HERE #############################################################################################
 
-    def _schedule_next_update(self):
-        # wait_time = 3600  # one hour
-        today = datetime.date(datetime.now())
-        tomorrow = today + timedelta(days=1)
-        tomorrow_dt = datetime.combine(tomorrow, datetime.min.time())
-        wait_time = (tomorrow_dt - datetime.now()).seconds + 30
-        return wait_time
-
-    async def _match_day_summary(self, ctx, match_day=None):
+    async def _match_day_summary(self, ctx, match_day):
         # team_roles = await self._get_team_roles(ctx.guild)
-        if match_day == 'last':
-            match_day = str(int(await self._get_match_day(ctx.guild)) - 1)
-            last = True
-        else:
-            last = False
-
-        if not match_day:
-            match_day = await self._get_match_day(ctx.guild)
-
         embed = discord.Embed(
             title="Franchise Results for Match Day {}".format(match_day),
             description="_Finding franchise results for match day {}..._".format(
@@ -1127,29 +1509,52 @@ class BCMatchGroups(commands.Cog):
         emoji_url = ctx.guild.icon_url
         if emoji_url:
             embed.set_thumbnail(url=emoji_url)
-        output_msg = await ctx.send(embed=embed)
+        progress = ProgressReporter(await ctx.send(embed=embed))
         team_roles = await self._get_team_roles(ctx.guild)
 
+        auth_token = await self._get_member_bc_token(ctx.message.author)
+
+        # Collect each team's results concurrently, filling in the summary as teams finish
+        semaphore = asyncio.Semaphore(bcConfig.SUMMARY_CONCURRENCY)
+        team_results = {}
+        pending = [self._get_team_results_bounded(ctx, team_role, match_day, auth_token, semaphore) for team_role in team_roles]
+        for next_team in asyncio.as_completed(pending):
+            team_role, results = await next_team
+            team_results[team_role.id] = results
+            progress.update(embed=self._get_match_day_summary_embed(match_day, team_roles, team_results, emoji_url))
+
+        await progress.finish(embed=self._get_match_day_summary_embed(match_day, team_roles, team_results, emoji_url))
+
+    async def _get_team_results_bounded(self, ctx, team_role, match_day, auth_token, semaphore):
+        """Gets a team's match day results once a slot in the semaphore frees up.
+        Falls back to the team's group owner token when no auth token is provided."""
+        async with semaphore:
+            if not auth_token:
+                owner = team_role.guild.get_member((await self._get_top_level_group(team_role.guild, team_role))[0])
+                auth_token = await self._get_member_bc_token(owner)
+            team_name = self._get_team_name(team_role)
+            try:
+                results = await self._get_team_results(ctx, team_name, match_day, auth_token)
+            except Exception:
+                results = [(0, 0, '')]
+        return team_role, results
+
+    def _get_match_day_summary_embed(self, match_day, team_roles, team_results, emoji_url=None):
         teams = []
         tiers = []
         all_results = []
         total_wins = 0
         total_losses = 0
-        auth_token = await self._get_member_bc_token(ctx.message.author)
+        for team_role in team_roles:
+            teams.append(self._get_team_name(team_role))
+            tiers.append(self._get_team_tier(team_role))
 
-        use_invoker_auth_token = True
-        if not auth_token:
-            use_invoker_auth_token = False
+            if team_role.id not in team_results:
+                all_results.append("_Loading..._")
+                continue
 
-        for team_role in team_roles:
-            if not use_invoker_auth_token:
-                owner = team_role.guild.get_member((await self._get_top_level_group(team_role.guild, team_role))[0])
-                auth_token = await self._get_member_bc_token(owner)
-            team_name = self._get_team_name(team_role)
-            results = await self._get_team_results(ctx, team_name, match_day, auth_token)
             team_scores = []
-
-            for result in results:
+            for result in team_results[team_role.id]:
                 wins, losses, opponent = result
                 total_wins += wins
                 total_losses += losses
@@ -1162,10 +1567,8 @@ class BCMatchGroups(commands.Cog):
                     team_scores.append("(Not Reported)")
                 else:
                     team_scores.append("{}-{} T".format(wins, losses))
-
-            teams.append(team_name)
-            tiers.append(self._get_team_tier(team_role))
             all_results.append(', '.join(team_scores))
+
         teams.append("**Franchise**")
         tiers.append("-")
         wp_str = self._get_wp_str(total_wins, total_losses)
@@ -1191,86 +1594,175 @@ class BCMatchGroups(commands.Cog):
             "\n".join(all_results)), inline=True)
         if emoji_url:
             embed.set_thumbnail(url=emoji_url)
-
-        await output_msg.edit(embed=embed)
+        return embed
 
     async def _get_team_results(self, ctx, franchise_team, match_day, auth_token, match_type=bcConfig.REGULAR_SEASON_MT):
-        guild = ctx.guild
-        team_role = await self._get_team_role(guild, franchise_team)
-        top_level_group_info = await self._get_top_level_group(guild, team_role)
+        team_role = await self._get_team_role(ctx.guild, franchise_team)
+        records = await self._get_match_day_records(ctx.guild, team_role, match_day, auth_token, match_type)
+        if not records:
+            return [(0, 0, '')]
+        return [(record['wins'], record['losses'], record['opponent']) for record in records]
+
+    async def _get_match_day_records(self, guild, team_role, match_day, auth_token, match_type=bcConfig.REGULAR_SEASON_MT, priority=bcConfig.INTERACTIVE_PRIORITY):
+        """Finds the team's reported series for a match day. Shared by the reporting and summary commands.
+        Returns a list of match records. If the team's match groups or a series can't be read, falls back to the stored records (or None)."""
+        # Series reported through bcReport don't change, so they are used without checking ballchasing
+        stored_records = await self._get_stored_results(guild, team_role, match_type, match_day)
+        if any(record.get('reported') for record in stored_records):
+            return stored_records
+
+        top_group_code = (await self._get_top_level_group(guild, team_role))[1]
+        match_groups = await self._get_match_type_subgroups(auth_token, top_group_code, match_type, priority=priority)
+        if match_groups is None:
+            return stored_records or None
+
+        stored_groups = {record['group']: record for record in stored_records}
+        records = []
+        for match_group in match_groups:
+            group_match_day, opposing_team = self._parse_match_group_name(match_group['name'])
+            if group_match_day != int(match_day):
+                continue
+            if match_group['id'] in stored_groups:
+                records.append(stored_groups[match_group['id']])
+                continue
 
-        # Get match_type subgroup from top-level-group
-        r = await self._bc_get_request(auth_token, '/groups', params=['group={}'.format(top_level_group_info[1])])
+            series_record = await self._get_series_record(auth_token, match_group['id'], team_role, priority=priority)
+            if series_record is None:
+                return stored_records or None
+            franchise_wins, franchise_losses, guessed = series_record
+            if franchise_wins or franchise_losses:
+                record = self._get_match_record(opposing_team, franchise_wins, franchise_losses, match_group['id'], guessed=guessed)
+                await self._save_match_result(guild, team_role, match_type, match_day, record)
+                records.append(record)
+
+        return records
+
+    async def _get_season_results(self, guild, team_role, auth_token, match_type=bcConfig.REGULAR_SEASON_MT):
+        """Collects a team's results for every match day. Stored results are reused, and any other match groups
+        are found in a single pass over the match type subgroup.
+        Returns a dict of match day -> [(wins, losses, opponent), ...]"""
+        stored_results = await self._get_stored_results(guild, team_role, match_type)
+        stored_groups = [record['group'] for records in stored_results.values() for record in records]
+
+        new_results = await self._fetch_season_records(guild, team_role, auth_token, match_type, skip_groups=stored_groups)
+        for match_day, records in (new_results or {}).items():
+            for record in records:
+                await self._save_match_result(guild, team_role, match_type, match_day, record)
+                stored_results.setdefault(match_day, []).append(record)
+
+        season_results = {}
+        for match_day, records in stored_results.items():
+            season_results[int(match_day)] = [(record['wins'], record['losses'], record['opponent']) for record in records]
+        return season_results
+
+    async def _fetch_season_records(self, guild, team_role, auth_token, match_type=bcConfig.REGULAR_SEASON_MT, skip_groups=[], priority=bcConfig.INTERACTIVE_PRIORITY):
+        """Reads a team's reported series from ballchasing in a single pass over its match type subgroup.
+        Returns a dict of match day (str) -> [match record, ...], or None if the groups or any series could not be read."""
+        top_group_code = (await self._get_top_level_group(guild, team_role))[1]
+        match_groups = await self._get_match_type_subgroups(auth_token, top_group_code, match_type, priority=priority)
+        if match_groups is None:
+            return None
 
-        data = r.json()
+        md_groups = []
+        for match_group in match_groups:
+            match_day, opposing_team = self._parse_match_group_name(match_group['name'])
+            if match_day and match_group['id'] not in skip_groups:
+                md_groups.append((match_day, opposing_team, match_group['id']))
 
-        opposing_team = ''
-        if 'list' not in data:
-            return [0, 0, opposing_team]
+        # fetch every match day's replays concurrently
+        semaphore = asyncio.Semaphore(bcConfig.SEASON_CONCURRENCY)
+
+        async def get_record(group_code):
+            async with semaphore:
+                return await self._get_series_record(auth_token, group_code, team_role, priority=priority)
+
+        records = await asyncio.gather(*[get_record(group_code) for _, _, group_code in md_groups])
+        if None in records:
+            return None
+
+        season_records = {}
+        for (match_day, opposing_team, group_code), (wins, losses, guessed) in zip(md_groups, records):
+            if wins or losses:
+                record = self._get_match_record(opposing_team, wins, losses, group_code, guessed=guessed)
+                season_records.setdefault(str(match_day), []).append(record)
+        return season_records
+
+    def _get_match_record(self, opposing_team, wins, losses, group_code, guessed=False, reported=False):
+        """Match record as stored in MatchResults. Guessed records (a side couldn't be resolved) are never stored,
+        and reported records (written by bcReport) are trusted without checking ballchasing."""
+        record = {'opponent': opposing_team, 'wins': wins, 'losses': losses, 'group': group_code, 'reported': reported}
+        if guessed:
+            record['guessed'] = True
+        return record
+
+    async def _get_match_type_subgroups(self, auth_token, top_group_code, match_type, priority=bcConfig.INTERACTIVE_PRIORITY):
+        """Lists the match groups (ex: "MD 01 vs Team") within a team's match type subgroup"""
+        subgroups = await self._get_subgroups(auth_token, top_group_code, priority=priority)
+        if not subgroups:
+            return None
 
         match_type_group_code = None
-        for sub_group in data['list']:
+        for sub_group in subgroups:
             if sub_group['name'] == match_type:
                 match_type_group_code = sub_group['id']
                 break
 
         if not match_type_group_code:
-            return [0, 0, opposing_team]
-
-        # Get match replay group from match_type subgroup
-        r = await self._bc_get_request(auth_token, '/groups', params=['group={}'.format(match_type_group_code)])
+            return None
 
+        return await self._get_subgroups(auth_token, top_group_code, match_type_group_code, priority=priority)
+
+    def _parse_match_group_name(self, group_name):
+        """Parses "MD <match day> vs <opposing team>" group names. Returns (None, '') for other names."""
+        match = re.match(r'^MD (\d+) vs (.*)$', group_name)
+        if not match:
+            return None, ''
+        return int(match.group(1)), match.group(2)
+
+    async def _get_series_record(self, auth_token, match_group_code, team_role, priority=bcConfig.INTERACTIVE_PRIORITY):
+        """Returns the team's (wins, losses, guessed) from the replays in a match group. guessed is True when the team's side
+        couldn't be resolved in some replay, and a side was picked at random for it.
+        Outcomes are memoized per group (unless guessed), and only recomputed when the group's replays change.
+        Returns None if the group's replays could not be listed."""
+        r = await self._bc_get_request(auth_token, '/replays', params=['group={}'.format(match_group_code)], priority=priority)
+        if r.status_code != 200:
+            return None
         data = r.json()
-
-        opposing_team = ''
-        if 'list' not in data:
-            return [0, 0, opposing_team]
-
-        # Get match summary from replays in group
-        results = []
-        for match_group in data['list']:
-            match_group_code = ''
-            if '{}'.format(match_day).zfill(2) in match_group['name']:
-                match_group_code = match_group['id']
-                opposing_team = match_group['name'].split(' vs ')[-1]
-
-            if not match_group_code:
-                continue
-
-            r = await self._bc_get_request(auth_token, '/replays', params=['group={}'.format(match_group_code)])
-            data = r.json()
-            if 'list' not in data:
-                continue
-
-            if not data['list']:
-                continue
-
-            franchise_wins = 0
-            franchise_losses = 0
-            for replay in data['list']:
-                is_blue = await self._check_if_blue(replay, team_role)
-
-                blue_goals = replay['blue']['goals'] if 'goals' in replay['blue'] else 0
-                orange_goals = replay['orange']['goals'] if 'goals' in replay['orange'] else 0
-
-                if is_blue:
-                    if blue_goals > orange_goals:
-                        franchise_wins += 1
-                    else:
-                        franchise_losses += 1
+        if not data.get('list'):
+            return 0, 0, False
+
+        replay_ids = tuple(sorted(replay['id'] for replay in data['list']))
+        memo_key = (match_group_code, team_role.id)
+        memoized = self.series_outcomes.get(memo_key)
+        if memoized and memoized[0] == replay_ids:
+            return memoized[1] + (False,)
+
+        franchise_wins = 0
+        franchise_losses = 0
+        guessed = False
+        for replay in data['list']:
+            is_blue = await self._check_if_blue(replay, team_role)
+            if is_blue is None:
+                is_blue = random.choice([True, False])
+                guessed = True
+
+            blue_goals = replay['blue']['goals'] if 'goals' in replay['blue'] else 0
+            orange_goals = replay['orange']['goals'] if 'goals' in replay['orange'] else 0
+
+            if is_blue:
+                if blue_goals > orange_goals:
+                    franchise_wins += 1
                 else:
-                    if blue_goals > orange_goals:
-                        franchise_losses += 1
-                    else:
-                        franchise_wins += 1
-
-            if franchise_wins or franchise_losses:
-                results.append(
-                    (franchise_wins, franchise_losses, opposing_team))
+                    franchise_losses += 1
+            else:
+                if blue_goals > orange_goals:
+                    franchise_losses += 1
+                else:
+                    franchise_wins += 1
 
-        if results:
-            return results
-        return [(0, 0, '')]
+        if not guessed:
+            self.series_outcomes[memo_key] = (replay_ids, (franchise_wins, franchise_losses))
+        return franchise_wins, franchise_losses, guessed
 
     async def _check_if_blue(self, replay, team_role):
         franchise_team = self._get_team_name(team_role)
@@ -1284,100 +1776,46 @@ class BCMatchGroups(commands.Cog):
         except:
             pass
 
-        blue_players = await self._get_replay_player_ids(replay, 'blue')
-        orange_players = await self._get_replay_player_ids(replay, 'orange')
-
-        franchise_roster = self._get_players_from_team_role(team_role)
-        for player in franchise_roster:
-            accounts = await self._get_all_accounts(player.id)
-            if accounts:
-                for account in accounts:
-                    if account in blue_players:
-                        return True
-                    elif account in orange_players:
-                        return False
-        return random.choice([True, False])
-
-    async def _get_replay_player_ids(self, replay_data, color):
-        players = []
-        for player in replay_data[color]['players']:
-            players.append([player['id']['platform'], player['id']['id']])
-        return players
+        platform_team_index = await self._get_platform_team_index(team_role.guild)
+        for color in ['blue', 'orange']:
+            for player in replay[color].get('players', []):
+                player_id = player.get('id', {})
+                account_key = "{}:{}".format(player_id.get('platform'), player_id.get('id'))
+                if team_role.id in platform_team_index.get(account_key, ()):
+                    return color == 'blue'
+        return None
 
-    async def _check_if_reported(self, ctx, auth_token, franchise_team, match_day, match_type=bcConfig.REGULAR_SEASON_MT):
-        guild = ctx.guild
-        team_role = await self._get_team_role(guild, franchise_team)
-        top_level_group_info = await self._get_top_level_group(guild, team_role)
+    async def _get_platform_team_index(self, guild):
+        """Maps each registered "platform:id" account of a rostered player to the ids of their team roles.
+        Rebuilt when the account register, team roles, or member roles change."""
+        register_version = self.account_manager_cog.account_register_version
+        cached = self.platform_team_indexes.get(guild.id)
+        if cached and cached[0] == register_version:
+            return cached[1]
 
-        r = await self._bc_get_request(auth_token, '/groups', params=['group={}'.format(top_level_group_info[1])])
-        data = r.json()
-        if 'list' not in data:
-            return None
+        account_register = await self.account_manager_cog.get_account_register()
+        platform_team_index = {}
+        for team_role in await self._get_team_roles(guild):
+            for member in await self._get_roster(team_role):
+                for platform, plat_id in account_register.get(str(member.id), []):
+                    platform_team_index.setdefault("{}:{}".format(platform, plat_id), set()).add(team_role.id)
 
-        match_type_group = None
-        for group in data['list']:
-            if group['name'] == match_type:
-                match_type_group = group['id']
-                break
+        self.platform_team_indexes[guild.id] = (register_version, platform_team_index)
+        return platform_team_index
 
-        if not match_type_group:
-            return None
-
-        r = await self._bc_get_request(auth_token, '/groups', params=['group={}'.format(match_type_group)])
-        data = r.json()
-        if 'list' not in data:
+    async def _check_if_reported(self, ctx, auth_token, franchise_team, match_day, match_type=bcConfig.REGULAR_SEASON_MT):
+        team_role = await self._get_team_role(ctx.guild, franchise_team)
+        records = await self._get_match_day_records(ctx.guild, team_role, match_day, auth_token, match_type)
+        if records is None:
             return None
 
         result_summaries = []
-        for group in data['list']:
-            match_group_code = ''
-            opposing_team = ''
-            if '{}'.format(match_day).zfill(2) in group['name']:
-                match_group_code = group['id']
-                opposing_team = group['name'].split(' vs ')[-1]
-
-            if not match_group_code:
-                continue
-
-            r = await self._bc_get_request(auth_token, '/replays', params=['group={}'.format(match_group_code)])
-            data = r.json()
-            # result_data = self._get_reported_match_data(ctx, data)
-            if 'list' not in data:
-                continue
-
-            if not data['list']:
-                continue
-
-            franchise_wins = 0
-            franchise_losses = 0
-            for replay in data['list']:
-                is_blue = await self._check_if_blue(replay, team_role)
-                blue_goals = replay['blue']['goals'] if 'goals' in replay['blue'] else 0
-                orange_goals = replay['orange']['goals'] if 'goals' in replay['orange'] else 0
-
-                if is_blue:
-                    if blue_goals > orange_goals:
-                        franchise_wins += 1
-                    else:
-                        franchise_losses += 1
-                else:
-                    if blue_goals > orange_goals:
-                        franchise_losses += 1
-                    else:
-                        franchise_wins += 1
-
-            if franchise_wins or franchise_losses:
-                summary = "**{}** {} - {} **{}**".format(
-                    franchise_team, franchise_wins, franchise_losses, opposing_team)
-                result_summaries.append(
-                    (summary, match_group_code, opposing_team))
-
+        for record in records:
+            summary = "**{}** {} - {} **{}**".format(
+                franchise_team, record['wins'], record['losses'], record['opponent'])
+            result_summaries.append((summary, record['group'], record['opponent']))
         return result_summaries
 
-    # TODO: Use this to reduce dup code between _check_if_reported and _get_team_results
-    async def _get_reported_match_data(self, ctx, response_data, team):
-        pass
-
     async def _find_match_replays(self, ctx, auth_token, member, match, team_players=None, search_count=None, sort_by=None, deep_search=False):
 
         # TODO: allow opposing_team to be None => ask in helper function
@@ -1391,11 +1829,6 @@ class BCMatchGroups(commands.Cog):
         # search for appearances in private matches
         endpoint = "/replays"
 
-        zone_adj = '-04:00'
-        # date_string = match['matchDate']
-        # match_date = datetime.strptime(date_string, '%B %d, %Y').strftime('%Y-%m-%d')
-        match_date = match['matchDate']
-
         if not sort_by:
             sort_by = bcConfig.sort_by
 
@@ -1406,17 +1839,6 @@ class BCMatchGroups(commands.Cog):
             'sort-dir={}'.format(bcConfig.sort_dir)
         ]
 
-        # if match_date:
-        #     # Filters by matches played on this day
-        #     start_match_date_rfc3339 = "{}T00:00:00{}".format(
-        #         match_date, zone_adj)
-        #     end_match_date_rfc3339 = "{}T23:59:59{}".format(
-        #         match_date, zone_adj)
-        #     params.append(
-        #         'replay-date-after={}'.format(start_match_date_rfc3339))
-        #     params.append(
-        #         'replay-date-before={}'.format(end_match_date_rfc3339))
-
         if search_count:
             params.append('count={}'.format(search_count))
         else:
@@ -1429,108 +1851,154 @@ class BCMatchGroups(commands.Cog):
         else:
             team_players.append(member)
 
-        # Search all players in game for replays until match is found
-        return_replay_ids = []
-        return_series_summary = None
-        return_winner = None
+        # Uploader searches are ordered by priority (invoker first)
+        steam_ids = []
         for player in team_players:
             for steam_id in await self._get_steam_ids(player.id):
-                # TODO: compare results to format, maybe add "skipped replays" field?
-                uploaded_by_param = 'uploader={}'.format(steam_id)
-                params.append(uploaded_by_param)
+                if steam_id not in steam_ids:
+                    steam_ids.append(steam_id)
+
+        # Bound searches to the match date when it's known, falling back to a wider window
+        series_found = None
+        for date_params in await self._get_replay_date_windows(ctx.guild, match['matchDate']):
+            series_found = await self._search_uploaders(ctx, auth_token, endpoint, params + date_params, steam_ids, match, deep_search)
+            if series_found:
+                break
 
-                r = await self._bc_get_request(auth_token, endpoint, params=params)
-                
-                if bcConfig.DEBUG and ctx.guild.id == 675121792741801994:
-                    channel = ctx.guild.get_channel(741758967260250213)
-                    await channel.send(params)
+        if not series_found:
+            return None
+        replay_ids, home_wins, away_wins, uploader_steam_id = series_found
 
-                data = r.json()
-                params.remove(uploaded_by_param)
-
-                # checks for correct replays
-                home_wins = 0
-                away_wins = 0
-                replay_ids = []
-                if 'list' in data:
-                    for replay in data['list']:
-                        if self.is_match_replay(match, replay):
-                            replay_ids.append(replay['id'])
-                            if replay['blue']['name'].lower() in match['home'].lower():
-                                home = 'blue'
-                                away = 'orange'
-                            else:
-                                home = 'orange'
-                                away = 'blue'
-
-                            # if not match['matchDate']:
-                            #     mm, dd, yyyy = replay['date'][0:10].split('-')
-                            #     match_date = datetime(
-                            #         int(yyyy), int(mm), int(dd))
-                            #     match_date_str = "{dt.month}/{dt.day}/{dt.year}".format(
-                            #         dt=match_date)
-                            #     match.update({'matchDate': match_date_str})
-
-                            home_goals = replay[home]['goals'] if 'goals' in replay[home] else 0
-                            away_goals = replay[away]['goals'] if 'goals' in replay[away] else 0
-                            if home_goals > away_goals:
-                                home_wins += 1
-                            else:
-                                away_wins += 1
-
-                    series_summary = "**{home_team}** {home_wins} - {away_wins} **{away_team}**".format(
-                        home_team=match['home'],
-                        home_wins=home_wins,
-                        away_wins=away_wins,
-                        away_team=match['away']
-                    )
-                    winner = None
-                    if home_wins > away_wins:
-                        winner = match['home']
-                    elif home_wins < away_wins:
-                        winner = match['away']
-
-                    if len(replay_ids) > len(return_replay_ids):
-                        return_replay_ids = replay_ids.copy()
-                    
-                    if return_replay_ids and not deep_search:
-                        return return_replay_ids, series_summary, winner
-        
-        if return_replay_ids:
-            return return_replay_ids, return_series_summary, return_winner
+        series_summary = "**{home_team}** {home_wins} - {away_wins} **{away_team}**".format(
+            home_team=match['home'],
+            home_wins=home_wins,
+            away_wins=away_wins,
+            away_team=match['away']
+        )
+        winner = None
+        if home_wins > away_wins:
+            winner = match['home']
+        elif home_wins < away_wins:
+            winner = match['away']
+
+        return replay_ids, series_summary, winner, uploader_steam_id
+
+    async def _get_replay_date_windows(self, guild, match_date):
+        """Returns the replay-date params to search with, narrowest window first.
+        Searches are unbounded when the match date isn't known."""
+        if not match_date:
+            return [[]]
+
+        guild_tz = pytz.timezone(await self._get_time_zone(guild))
+        day_start = guild_tz.localize(datetime.combine(match_date, datetime.min.time()))
+
+        date_windows = []
+        for padding in [timedelta(hours=bcConfig.REPLAY_DATE_WINDOW_HOURS), timedelta(days=bcConfig.WIDE_REPLAY_DATE_WINDOW_DAYS)]:
+            window_start = (day_start - padding).astimezone(pytz.UTC)
+            window_end = (day_start + timedelta(days=1) + padding).astimezone(pytz.UTC)
+            date_windows.append([
+                'replay-date-after={}'.format(window_start.strftime('%Y-%m-%dT%H:%M:%SZ')),
+                'replay-date-before={}'.format(window_end.strftime('%Y-%m-%dT%H:%M:%SZ'))
+            ])
+        return date_windows
+
+    async def _search_uploaders(self, ctx, auth_token, endpoint, params, steam_ids, match, deep_search=False):
+        """Runs each uploader's replay search concurrently. The highest priority search with a complete series wins,
+        so results don't depend on response order. Returns (replay_ids, home_wins, away_wins, uploader steam id) or None"""
+        semaphore = asyncio.Semaphore(bcConfig.REPLAY_SEARCH_CONCURRENCY)
+        search_tasks = {}
+        for search_index, steam_id in enumerate(steam_ids):
+            search = self._search_uploader_replays(ctx, auth_token, endpoint, params, steam_id, match, semaphore)
+            search_tasks[asyncio.ensure_future(search)] = search_index
+
+        search_results = {}
+        pending = set(search_tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    search_results[search_tasks[task]] = task.result()
+                except Exception:
+                    search_results[search_tasks[task]] = None
 
-        return None
+            if deep_search:
+                continue
+
+            # once a complete series is found, only searches ahead of it in priority can still win
+            complete = [i for i, result in search_results.items() if result and len(result[0]) >= bcConfig.SERIES_GAMES]
+            if complete:
+                for task in list(pending):
+                    if search_tasks[task] > min(complete):
+                        task.cancel()
+                        pending.discard(task)
+
+        found = [(i, result) for i, result in search_results.items() if result and result[0]]
+        if not found:
+            return None
+
+        if deep_search:
+            # most replays found, ties go to the higher priority search
+            return max(found, key=lambda found_result: (len(found_result[1][0]), -found_result[0]))[1]
+
+        complete = [found_result for found_result in found if len(found_result[1][0]) >= bcConfig.SERIES_GAMES]
+        return min(complete or found, key=lambda found_result: found_result[0])[1]
+
+    async def _search_uploader_replays(self, ctx, auth_token, endpoint, params, steam_id, match, semaphore):
+        """Searches one uploader's replays for the match. Returns (replay_ids, home_wins, away_wins, uploader steam id)"""
+        uploader_params = params + ['uploader={}'.format(steam_id)]
+        async with semaphore:
+            r = await self._bc_get_request(auth_token, endpoint, params=uploader_params)
+
+        if bcConfig.DEBUG and ctx.guild.id == 675121792741801994:
+            channel = ctx.guild.get_channel(741758967260250213)
+            await channel.send(uploader_params)
+
+        data = r.json()
+
+        # checks for correct replays
+        home_wins = 0
+        away_wins = 0
+        replay_ids = []
+        for replay in data.get('list', []):
+            if self.is_match_replay(match, replay):
+                replay_ids.append(replay['id'])
+                if replay['blue']['name'].lower() in match['home'].lower():
+                    home = 'blue'
+                    away = 'orange'
+                else:
+                    home = 'orange'
+                    away = 'blue'
+
+                home_goals = replay[home]['goals'] if 'goals' in replay[home] else 0
+                away_goals = replay[away]['goals'] if 'goals' in replay[away] else 0
+                if home_goals > away_goals:
+                    home_wins += 1
+                else:
+                    away_wins += 1
+
+        return replay_ids, home_wins, away_wins, steam_id
 
     async def _discover_match_opponent(self, ctx, match_data):
         pass
 
     async def _update_match_day(self, guild, channel=None, force_set=False):
-        all_matches = await self._get_match_dates(guild)
+        """Sets the match day from the match calendar. Between match dates, the match day is the last one played,
+        which is only applied when force_set is passed."""
+        calendar = await self._get_match_calendar(guild)
         match_day = await self._get_match_day(guild)
-        if match_day == None or not all_matches:
+        if match_day == None or not calendar:
+            return
+        today = await self._get_guild_today(guild)
+        if not calendar.is_match_date(today) and not force_set:
             return
-        now = datetime.now()
-        diff = 1
-        today = "{dt.month}/{dt.day}/{dt.year}".format(dt=now)
-        # await channel.send(today)
-        # await channel.send([str("{}".format(match)) for match in all_matches])
-        if today not in all_matches and force_set:
-            all_dates = []
-            for match in all_matches:
-                mm, dd, yy = match.split('/')
-                all_dates.append(datetime(int(yy), int(mm), int(dd)))
-
-            this_date = datetime(now.year, now.month, now.day)
-            if this_date not in all_dates:
-                all_dates.append(this_date)
-                diff = 0
-            all_dates.sort()
-            all_matches = [
-                "{dt.month}/{dt.day}/{dt.year}".format(dt=date) for date in all_dates]
 
-        new_match_day = all_matches.index(today) + diff
+        new_match_day = calendar.get_match_day(today)
         if str(match_day) != str(new_match_day):
             await self._save_match_day(guild, new_match_day)
+            if self.account_manager_cog:
+                key = ('warmMatchDay', guild.id, new_match_day)
+                # outside the per-guild job limit so it doesn't hold a slot members need for their own commands
+                self.account_manager_cog.submit_job(guild, 'warmMatchDay', key, self._warm_match_day_caches, guild, new_match_day, guild_limited=False)
             if str(guild.id) == str(675121792741801994):
                 if guild.system_channel and not channel:
                     channel = guild.system_channel
@@ -1542,14 +2010,7 @@ class BCMatchGroups(commands.Cog):
                 return True
 
     async def _get_roster(self, team_role: discord.Role):
-        return team_role.members
-
-    async def _get_all_accounts(self, discord_id):
-        discord_id = str(discord_id)
-        account_register = await self.account_manager_cog.get_account_register()
-        if discord_id in account_register:
-            return account_register[discord_id]
-        return []
+        return (await self._get_team_role_index(team_role.guild)).get_roster(team_role)
 
     async def _get_steam_id_from_token(self, auth_token):
         r = await self._bc_get_request(auth_token, '')
@@ -1569,31 +2030,20 @@ class BCMatchGroups(commands.Cog):
 
     # maybe outdated?
     async def _get_member_team_roles(self, guild, member):
-        team_roles = await self.config.guild(guild).TeamRoles()
-        player_team_roles = []
-        for role in member.roles:
-            if role.id in team_roles:
-                player_team_roles.append(role)
-        return player_team_roles
+        return (await self._get_team_role_index(guild)).get_member_team_roles(member)
 
     async def _match_team_role(self, guild, member=None, team_name=None):
         """Retreives the role for a specified team. If teaam_name is not provided, matches to the invoker's team."""
-        team_roles = await self._get_team_roles(guild)
+        team_role_index = await self._get_team_role_index(guild)
         # Find from team_name
         if team_name:
-            for role in team_roles:
-                if team_name.lower() == role.name.lower() or (team_name.lower() in ' '.join(role.name.split()[: -1]).lower()) or (len(role.name.split()) > 1 and team_name.lower() == (role.name.split()[-1][1: -1]).lower()):
-                    return role
-            return None
+            return team_role_index.find(team_name)
 
         if not member:
             return None
 
         # Find member's team
-        for role in team_roles:
-            if role in member.roles:
-                return role
-        return None
+        return team_role_index.get_member_team_role(member)
 
     def _get_team_name(self, role: discord.Role):
         if role.name[-1] == ')' and ' (' in role.name:
@@ -1606,20 +2056,13 @@ class BCMatchGroups(commands.Cog):
         await team_role.edit(name=new_role_name)
 
     async def _get_team_role(self, guild, team_name_or_player):
-        team_roles = await self._get_team_roles(guild)
+        team_role_index = await self._get_team_role_index(guild)
 
         if type(team_name_or_player) == discord.Member:
-            player = team_name_or_player
-            for role in player.roles:
-                if role in team_roles:
-                    return role
+            return team_role_index.get_member_team_role(team_name_or_player)
 
         elif type(team_name_or_player) == str:
-            team_name = team_name_or_player
-            for role in team_roles:
-                if team_name.lower() in role.name.lower():
-                    return role
-            return None
+            return team_role_index.find(team_name_or_player)
 
         return None
 
@@ -1743,7 +2186,6 @@ class BCMatchGroups(commands.Cog):
         bc_group_owner = ctx.guild.get_member(top_level_group_info[0])
         top_group_code = top_level_group_info[1]
         auth_token = await self._get_member_bc_token(bc_group_owner)
-        bc_group_owner_steam = await self._get_steam_id_from_token(auth_token)
 
         # <top level group>/MD <Match Day> vs <Opposing Team>
 
@@ -1760,51 +2202,21 @@ class BCMatchGroups(commands.Cog):
         ]
 
         endpoint = '/groups'
-        params = [
-            # 'creator={}'.format(bc_group_owner_steam),
-            'group={}'.format(top_group_code)
-        ]
-
-        r = await self._bc_get_request(auth_token, endpoint, params=params)
-        data = r.json()
-
-        debug = False
-        if debug:
-            await ctx.send(len(data['list']))
-            await ctx.send(bc_group_owner_steam)
-            await ctx.send(top_group_code)
-            await ctx.send('{}?{}'.format(endpoint, '&'.join(params)))
 
         # Dynamically create sub-group
         current_subgroup_id = top_group_code
-        next_subgroup_id = None
         for next_group_name in ordered_subgroups:
-            if next_subgroup_id:
-                current_subgroup_id = next_subgroup_id
             next_subgroup_id = None
 
-            # Check if next subgroup exists
-            if 'list' in data:
-                for data_subgroup in data['list']:
-                    if debug:
-                        await ctx.send(data_subgroup)
-                    if data_subgroup['name'] == next_group_name:
-                        next_subgroup_id = data_subgroup['id']
-                        break
-
-            # Prepare & Execute  Next request:
-            # ## Next subgroup found: request its contents
-            if next_subgroup_id:
-                params = [
-                    'creator={}'.format(bc_group_owner),
-                    'group={}'.format(next_subgroup_id)
-                ]
-
-                r = await self._bc_get_request(auth_token, endpoint, params)
-                data = r.json()
+            # Check if next subgroup exists (served from the group tree cache when possible)
+            subgroups = await self._get_subgroups(auth_token, top_group_code, current_subgroup_id)
+            for data_subgroup in subgroups or []:
+                if data_subgroup['name'] == next_group_name:
+                    next_subgroup_id = data_subgroup['id']
+                    break
 
             # ## Creating next sub-group
-            else:
+            if not next_subgroup_id:
                 payload = {
                     'name': next_group_name,
                     'parent': current_subgroup_id,
@@ -1818,54 +2230,67 @@ class BCMatchGroups(commands.Cog):
                 except:
                     await ctx.send(":x: Error creating Ballchasing group: {}".format(next_group_name))
                     return False
+                self.group_tree_cache.add_subgroup(top_group_code, current_subgroup_id, next_subgroup_id, next_group_name)
 
-        return next_subgroup_id
+            current_subgroup_id = next_subgroup_id
 
-    async def _download_replays(self, auth_token, replay_ids):
-        tmp_replay_files = []
-        this_game = 1
-        for replay_id in replay_ids[::-1]:
-            endpoint = "/replays/{}/file".format(replay_id)
-            r = await self._bc_get_request(auth_token, endpoint)
+        return current_subgroup_id
 
-            # replay_filename = "Game {}.replay".format(this_game)
-            replay_filename = "{}.replay".format(replay_id)
+    async def _get_subgroups(self, auth_token, top_group_code, group_code=None, priority=bcConfig.INTERACTIVE_PRIORITY):
+        """Lists the subgroups of a group in a team's tree, using the group tree cache where possible.
+        Returns None if the listing could not be retrieved."""
+        if not group_code:
+            group_code = top_group_code
+        subgroups = self.group_tree_cache.get(top_group_code, group_code)
+        if subgroups is not None:
+            return subgroups
 
-            tf = tempfile.NamedTemporaryFile()
-            tf.name += ".replay"
-            tf.write(r.content)
-            tmp_replay_files.append(tf)
-            this_game += 1
+        params = ['group={}'.format(group_code), 'count=200']
+        r = await self._bc_get_request(auth_token, '/groups', params=params, priority=priority)
+        if r.status_code != 200:
+            return None
+        data = r.json()
+        if 'list' not in data:
+            return None
 
-        return tmp_replay_files
+        subgroups = [{'id': group['id'], 'name': group['name']} for group in data['list']]
+        self.group_tree_cache.set(top_group_code, group_code, subgroups)
+        return subgroups
 
-    async def _upload_replays(self, auth_token, subgroup_id, files_to_upload, ctx=None):
-        endpoint = "/v2/upload"
+    async def _transfer_replays(self, auth_token, dest_auth_token, subgroup_id, replay_ids, ctx=None, priority=bcConfig.INTERACTIVE_PRIORITY, reparent=True, existing_ids=()):
+        """Streams replays into the subgroup (oldest first). Returns a dict of source replay id -> replay id in the subgroup.
+        A replay the destination account already uploaded (409) is moved into the subgroup, unless reparent is False,
+        in which case it's left where it is and only counts as transferred if its id is in existing_ids."""
         params = [
             'visibility={}'.format(bcConfig.visibility),
             'group={}'.format(subgroup_id)
         ]
+        replay_ids = replay_ids[::-1]
+        responses = await self.account_manager_cog.bc_transfer_replays(auth_token, replay_ids, dest_auth_token, params, priority=priority)
 
-        replay_ids_in_group = []
-        for replay_file in files_to_upload:
-            replay_file.seek(0)
-            files = {'file': replay_file}
-
-            r = await self._bc_post_request(auth_token, endpoint, params=params, files=files)
+        replay_ids_in_group = {}
+        for replay_id, r in zip(replay_ids, responses):
+            if not r:
+                if ctx:
+                    await ctx.send(":x: Connection error transferring replay.")
+                continue
 
             status_code = r.status_code
             data = r.json()
 
             try:
                 if status_code == 201:
-                    replay_ids_in_group.append(data['id'])
+                    replay_ids_in_group[replay_id] = data['id']
+                elif status_code == 409 and not reparent:
+                    if data['id'] in existing_ids:
+                        replay_ids_in_group[replay_id] = data['id']
                 elif status_code == 409:
                     payload = {
                         'group': subgroup_id
                     }
-                    r = await self._bc_patch_request(auth_token, '/replays/{}'.format(data['id']), json=payload)
+                    r = await self._bc_patch_request(dest_auth_token, '/replays/{}'.format(data['id']), json=payload, priority=priority)
                     if r.status_code == 204:
-                        replay_ids_in_group.append(data['id'])
+                        replay_ids_in_group[replay_id] = data['id']
                     elif ctx:
                         await ctx.send(":x: {} error: {}".format(r.status_code, r.json()['error']))
             except:
@@ -1874,25 +2299,48 @@ class BCMatchGroups(commands.Cog):
 
         return replay_ids_in_group
 
-    async def _rename_replays(self, ctx, auth_token, uploaded_replays_ids):
-        renamed = []
+    async def _plan_replay_transfers(self, owner_auth_token, replay_ids, uploader_steam_id):
+        """Splits replays into those the group owner uploaded (which can be moved directly), and those that must be copied.
+        Returns (owned replay ids, foreign replay ids)"""
+        owner_steam_id = await self._get_steam_id_from_token(owner_auth_token)
+        if owner_steam_id and str(owner_steam_id) == str(uploader_steam_id):
+            return replay_ids, []
+        return [], replay_ids
 
-        game_number = 1
-        for replay_id in uploaded_replays_ids:
-            endpoint = '/replays/{}'.format(replay_id)
-            payload = {
-                'title': 'Game {}'.format(game_number)
-            }
-            r = await self._bc_patch_request(auth_token, endpoint, json=payload)
-            status_code = r.status_code
+    async def _move_replays(self, auth_token, subgroup_id, replay_ids, ctx=None, priority=bcConfig.INTERACTIVE_PRIORITY):
+        """Moves replays owned by the auth token's account into the subgroup. Returns a dict of replay id -> replay id."""
+        payload = {
+            'group': subgroup_id
+        }
+        responses = await asyncio.gather(*[
+            self._bc_patch_request(auth_token, '/replays/{}'.format(replay_id), json=payload, priority=priority)
+            for replay_id in replay_ids
+        ])
+
+        moved = {}
+        for replay_id, r in zip(replay_ids, responses):
+            if r.status_code == 204:
+                moved[replay_id] = replay_id
+            elif ctx:
+                await ctx.send(":x: {} error moving replay {}.".format(r.status_code, replay_id))
+        return moved
+
+    async def _rename_replays(self, auth_token, uploaded_replays_ids):
+        """Titles the replays "Game N" in the given order, concurrently under the shared rate limiter.
+        Returns (renamed replay ids, {replay id: status code} for each rename that failed)"""
+        responses = await asyncio.gather(*[
+            self._bc_patch_request(auth_token, '/replays/{}'.format(replay_id), json={'title': 'Game {}'.format(game_number)})
+            for game_number, replay_id in enumerate(uploaded_replays_ids, 1)
+        ])
 
-            if status_code == 204:
+        renamed = []
+        failed = {}
+        for replay_id, r in zip(uploaded_replays_ids, responses):
+            if r.status_code == 204:
                 renamed.append(replay_id)
             else:
-                await ctx.send(":x: {} error.".format(status_code))
-
-            game_number += 1
-        return renamed
+                failed[replay_id] = r.status_code
+        return renamed, failed
 
     def _find_role_by_name(self, guild, role_name):
         for role in guild.roles:
@@ -1900,13 +2348,6 @@ class BCMatchGroups(commands.Cog):
                 return role
         return None
 
-    def _get_players_from_team_role(self, team_role):
-        roster = []
-        for member in team_role.guild.members:
-            if team_role in member.roles:
-                roster.append(member)
-        return roster
-
     def _get_wp(self, wins, losses):
         return wins/(wins+losses)
 
@@ -1944,25 +2385,20 @@ class BCMatchGroups(commands.Cog):
             return discord.Color.from_rgb(red_scale, green_scale, blue_scale)
 
     async def _get_match_date(self, guild, match_day=None):
+        """Date the match day is played on, or today (in the guild's time zone) if it isn't on the calendar"""
         if not match_day:
-            match_day = self._get_match_day(guild)
-        match_day = int(match_day)
+            match_day = await self._get_match_day(guild)
+        match_date = (await self._get_match_calendar(guild)).get_match_date(match_day)
+        return match_date or await self._get_guild_today(guild)
 
-        all_matches = await self._get_match_dates(guild)
+    async def _get_match_calendar(self, guild):
+        calendar = self.match_calendars.get(guild.id)
+        if calendar is None:
+            calendar = self.match_calendars[guild.id] = MatchCalendar(await self._get_match_dates(guild))
+        return calendar
 
-        # if not all_matches:
-        #     return None
-
-        now = datetime.now()
-        diff = 1
-        today = "{dt.month}/{dt.day}/{dt.year}".format(dt=now)
-
-        match_date = today
-
-        if today in all_matches and len(all_matches) >= match_day:
-            match_date = all_matches[match_day - diff]
-
-        return match_date
+    async def _get_guild_today(self, guild):
+        return datetime.now(pytz.timezone(await self._get_time_zone(guild))).date()
 
 # json dict
     async def _get_match_dates(self, guild):
@@ -1970,6 +2406,13 @@ class BCMatchGroups(commands.Cog):
 
     async def _save_match_dates(self, guild, match_dates):
         await self.config.guild(guild).MatchDates.set(match_dates)
+        self.match_calendars[guild.id] = MatchCalendar(match_dates)
+
+    async def _get_time_zone(self, guild):
+        return (await self.config.guild(guild).TimeZone()) or bcConfig.DEFAULT_TIME_ZONE
+
+    async def _save_time_zone(self, guild, time_zone):
+        await self.config.guild(guild).TimeZone.set(time_zone)
 
     async def _get_match_day(self, guild):
         return int(await self.config.guild(guild).MatchDay())
@@ -1978,10 +2421,56 @@ class BCMatchGroups(commands.Cog):
         await self.config.guild(guild).MatchDay.set(match_day)
 
     async def _get_team_roles(self, guild):
-        team_role_ids = await self.config.guild(guild).TeamRoles()
-        team_roles = [guild.get_role(role_id) for role_id in team_role_ids]
-        team_roles.sort(key=lambda tr: tr.position, reverse=True)
-        return team_roles
+        return list((await self._get_team_role_index(guild)).roles)
+
+    async def _get_team_role_index(self, guild):
+        team_role_index = self.team_role_indexes.get(guild.id)
+        if not team_role_index:
+            team_role_ids = await self.config.guild(guild).TeamRoles()
+            team_roles = [guild.get_role(role_id) for role_id in team_role_ids]
+            aliases = {int(role_id): team_name for role_id, team_name in (await self.config.guild(guild).TeamNameChanges()).items()}
+            team_role_index = self.team_role_indexes[guild.id] = TeamRoleIndex(team_roles, aliases)
+        return team_role_index
+
+    async def _get_stored_results(self, guild, team_role, match_type, match_day=None):
+        """Stored match records for a team. Returns a list of records for a match day,
+        otherwise a dict of match day -> [match record, ...]"""
+        if match_day is not None:
+            return await self.config.guild(guild).MatchResults.get_raw(str(team_role.id), match_type, str(int(match_day)), default=[])
+        return await self.config.guild(guild).MatchResults.get_raw(str(team_role.id), match_type, default={})
+
+    async def _save_match_result(self, guild, team_role, match_type, match_day, record):
+        if record.get('guessed'):
+            return
+        records = await self._get_stored_results(guild, team_role, match_type, match_day)
+        records = [stored for stored in records if stored['group'] != record['group']]
+        records.append(record)
+        await self.config.guild(guild).MatchResults.set_raw(str(team_role.id), match_type, str(int(match_day)), value=records)
+
+    async def _save_stored_results(self, guild, team_role, match_type, results):
+        results = {match_day: [record for record in records if not record.get('guessed')] for match_day, records in results.items()}
+        await self.config.guild(guild).MatchResults.set_raw(str(team_role.id), match_type, value=results)
+
+    async def _clear_stored_results(self, guild):
+        await self.config.guild(guild).MatchResults.set({})
+
+    async def _get_group_copies(self, guild):
+        return await self.config.guild(guild).GroupCopies()
+
+    async def _find_group_copy(self, guild, member, source_code, mirror_code=None):
+        """Unfinished copy of the source group made by the member (into mirror_code, if given), or None"""
+        for mirror, copy_state in (await self._get_group_copies(guild)).items():
+            if mirror in self.group_copies:
+                continue
+            if copy_state['owner'] == member.id and copy_state['source'] == source_code and mirror_code in [None, mirror]:
+                return copy_state
+        return None
+
+    async def _save_group_copy(self, guild, copy_state):
+        await self.config.guild(guild).GroupCopies.set_raw(copy_state['mirror'], value=copy_state)
+
+    async def _remove_group_copy(self, guild, mirror_code):
+        await self.config.guild(guild).GroupCopies.clear_raw(mirror_code)
 
     async def _save_temp_team_name_change(self, guild, team_role: discord.Role, temp_name: str):
         temp_team_names = {}
@@ -1992,6 +2481,7 @@ class BCMatchGroups(commands.Cog):
                 del temp_team_names[str(team_role.id)]
 
         await self.config.guild(guild).TeamNameChanges.set(temp_team_names)
+        self.team_role_indexes.pop(guild.id, None)
     
     async def _get_original_team_name(self, guild, team_role: discord.Role):
         return (await self.config.guild(guild).TeamNameChanges()).get(str(team_role.id), None)
@@ -2012,6 +2502,8 @@ class BCMatchGroups(commands.Cog):
 
     async def _save_team_roles(self, guild, roles):
         await self.config.guild(guild).TeamRoles.set(roles)
+        self.platform_team_indexes.pop(guild.id, None)
+        self.team_role_indexes.pop(guild.id, None)
     
     async def _get_member_bc_token(self, member: discord.Member):
         return await self.account_manager_cog._get_member_bc_token(member)
@@ -1,4 +1,5 @@
 from datetime import datetime
+from accountManager.config import config as account_config
 # Discord ID: Steam ID -- maybe handle multiple accounts?
 
 # ###############################################################################
@@ -20,6 +21,37 @@ class bcConfig:
     sort_by = 'created'
     sort_dir = 'desc'                               # 'asc'
 
+    # ballchasing rate limiter lanes, owned by the accountManager's client (lower is served first)
+    INTERACTIVE_PRIORITY = account_config.bc_interactive_priority
+    BACKGROUND_PRIORITY = account_config.bc_background_priority
+
+    # CACHE SETTINGS
+    GROUP_CACHE_TTL = 3600                          # seconds a cached group listing is trusted
+    RESULTS_RECONCILE_INTERVAL = 6*3600             # seconds between reconciling stored match results with ballchasing
+
+    # CONCURRENCY SETTINGS
+    SUMMARY_CONCURRENCY = 4                         # teams looked up at once by matchDaySummary
+    SEASON_CONCURRENCY = 5                          # match groups looked up at once by getSeasonPerformance
+    REPLAY_SEARCH_CONCURRENCY = 4                   # uploaders searched at once by bcReport
+    COPY_WORKERS = 3                                # groups/replays copied at once by copyGroup
+    COPY_CHECKPOINT_INTERVAL = 10                   # replays copied between copyGroup checkpoints
+
+    # OUTPUT SETTINGS (discord limits)
+    EMBEDS_PER_MESSAGE = 10
+    EMBED_FIELD_LIMIT = 25
+    EMBED_FIELD_NAME_LIMIT = 256
+    EMBED_FIELD_VALUE_LIMIT = 1024
+    EMBED_DESCRIPTION_LIMIT = 2048
+    EMBED_SIZE_LIMIT = 6000
+
+    # SERIES SETTINGS
+    SERIES_GAMES = 4                                # games in a complete regular season series
+
+    # REPLAY SEARCH DATE WINDOWS
+    DEFAULT_TIME_ZONE = 'America/New_York'          # used until a guild sets its match time zone
+    REPLAY_DATE_WINDOW_HOURS = 6                    # padding around the match date
+    WIDE_REPLAY_DATE_WINDOW_DAYS = 3                # padding for the fallback search
+
     # MATCH TYPE KEYWORDS
 
     REGULAR_SEASON_MT = "Regular Season"
@@ -0,0 +1,49 @@
+from .bc_config import bcConfig
+import time
+
+
+class GroupTreeCache:
+    """In-memory cache of each team's ballchasing group tree.
+
+    Trees are keyed by the team's top-level group code (from ReplayGroups), and each node holds the
+    subgroup listing of one group in that tree. Listings expire after `ttl` seconds.
+    """
+
+    def __init__(self, ttl=bcConfig.GROUP_CACHE_TTL):
+        self.ttl = ttl
+        self._trees = {}    # top level group code -> {group code: (expires_at, [{'id': ..., 'name': ...}])}
+
+    def get(self, top_group_code, group_code):
+        tree = self._trees.get(top_group_code, {})
+        node = tree.get(group_code)
+        if not node:
+            return None
+        expires_at, subgroups = node
+        if expires_at < time.monotonic():
+            del tree[group_code]
+            return None
+        return subgroups
+
+    def set(self, top_group_code, group_code, subgroups):
+        tree = self._trees.setdefault(top_group_code, {})
+        tree[group_code] = (time.monotonic() + self.ttl, subgroups)
+
+    def extend(self, top_group_code, ttl):
+        """Keeps the tree's current listings for at least another `ttl` seconds (i.e. listings preloaded for a match day)"""
+        expires_at = time.monotonic() + ttl
+        tree = self._trees.get(top_group_code, {})
+        for group_code, (node_expires_at, subgroups) in tree.items():
+            tree[group_code] = (max(node_expires_at, expires_at), subgroups)
+
+    def add_subgroup(self, top_group_code, parent_code, subgroup_id, name):
+        """Records a newly created subgroup so the parent's listing stays current, and seeds the new (empty) node"""
+        parent_subgroups = self.get(top_group_code, parent_code)
+        if parent_subgroups is not None:
+            parent_subgroups.append({'id': subgroup_id, 'name': name})
+        self.set(top_group_code, subgroup_id, [])
+
+    def invalidate(self, top_group_code=None):
+        if top_group_code:
+            self._trees.pop(top_group_code, None)
+        else:
+            self._trees.clear()
@@ -0,0 +1,39 @@
+from datetime import date
+import bisect
+
+
+class MatchCalendar:
+    """A guild's match dates, parsed and sorted once so match day lookups are a bisect.
+
+    Match dates are stored in config as "M/D/YYYY" strings. Match day N is played on dates[N-1].
+    """
+
+    def __init__(self, match_dates=[]):
+        self.dates = sorted(self.parse_date(match_date) for match_date in match_dates)
+
+    @staticmethod
+    def parse_date(match_date):
+        mm, dd, yyyy = match_date.split('/')
+        return date(int(yyyy), int(mm), int(dd))
+
+    @staticmethod
+    def format_date(match_date):
+        return "{dt.month}/{dt.day}/{dt.year}".format(dt=match_date)
+
+    def __len__(self):
+        return len(self.dates)
+
+    def is_match_date(self, day):
+        index = bisect.bisect_left(self.dates, day)
+        return index < len(self.dates) and self.dates[index] == day
+
+    def get_match_date(self, match_day):
+        """Date match day is played on, or None if it isn't on the calendar"""
+        match_day = int(match_day)
+        if 0 < match_day <= len(self.dates):
+            return self.dates[match_day - 1]
+        return None
+
+    def get_match_day(self, day):
+        """Match day as of the given date: the match day played that day, otherwise the last one played (0 before the season)"""
+        return bisect.bisect_right(self.dates, day)
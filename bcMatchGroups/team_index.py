@@ -0,0 +1,85 @@
+class TeamRoleIndex:
+    """Lookup index of a guild's team roles.
+
+    Team roles are named "<Team Name>" or "<Team Name> (<tier>)". Each role is indexed by its full name, its team name,
+    its tier, and any aliases (such as the original name of a temporarily renamed team), all normalized. When more than
+    one role shares a key (i.e. a tier), the highest role wins.
+    """
+
+    def __init__(self, team_roles, aliases={}):
+        self.roles = sorted([role for role in team_roles if role], key=lambda role: role.position, reverse=True)
+        self.role_ids = set(role.id for role in self.roles)
+        self._keys = {}
+        self._rosters = None    # team role id -> {member id: None}, built on first use
+        self._team_names = []   # (normalized team name, role) in role order, for partial name matches
+        for role in self.roles:
+            team_name, tier = self.split_role_name(role.name)
+            self._team_names.append((self.normalize(team_name), role))
+            for key in [role.name, team_name, tier, aliases.get(role.id)]:
+                if key:
+                    self._keys.setdefault(self.normalize(key), role)
+
+    @staticmethod
+    def normalize(name):
+        return ' '.join(name.lower().split())
+
+    @staticmethod
+    def split_role_name(role_name):
+        """Returns (team name, tier) from a team role name. Tier is None if the role has none."""
+        if role_name[-1] == ')' and ' (' in role_name:
+            opi = role_name.index(' (')
+            return role_name[:opi], role_name[opi+2:-1]
+        return role_name, None
+
+    def find(self, team_name):
+        """Role for a team name, tier, or alias. Falls back to the first team whose name contains team_name."""
+        key = self.normalize(team_name)
+        role = self._keys.get(key)
+        if role or not key:
+            return role
+        for normalized_name, role in self._team_names:
+            if key in normalized_name:
+                return role
+        return None
+
+    def get_member_team_roles(self, member):
+        return [role for role in member.roles if role.id in self.role_ids]
+
+    def get_roster(self, team_role):
+        """Members of a team role. Rosters for every team are built from one pass over the guild's members,
+        then kept current with update_member, so lookups scale with the roster rather than the guild."""
+        if self._rosters is None:
+            self._rosters = {role_id: {} for role_id in self.role_ids}
+            for member in team_role.guild.members:
+                self._add_member(member)
+        roster = []
+        for member_id in self._rosters.get(team_role.id, {}):
+            member = team_role.guild.get_member(member_id)
+            if member:
+                roster.append(member)
+        return roster
+
+    def update_member(self, before, after):
+        if self._rosters is None:
+            return
+        self.remove_member(before)
+        self._add_member(after)
+
+    def remove_member(self, member):
+        if self._rosters is None:
+            return
+        for roster in self._rosters.values():
+            roster.pop(member.id, None)
+
+    def _add_member(self, member):
+        for role in member.roles:
+            if role.id in self.role_ids:
+                self._rosters[role.id][member.id] = None
+
+    def get_member_team_role(self, member):
+        """The member's highest team role, or None"""
+        member_role_ids = set(role.id for role in member.roles)
+        for role in self.roles:
+            if role.id in member_role_ids:
+                return role
+        return None
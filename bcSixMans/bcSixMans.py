@@ -1,9 +1,8 @@
 
 from .config import config
-import tempfile
+from accountManager import ProgressReporter
 import discord
 import asyncio
-import requests
 import urllib.parse
 
 from datetime import datetime
@@ -165,70 +164,28 @@ class BCSixMans(commands.Cog):
         if not await self._get_top_level_group(guild):
             return
         if game.state == config.GS_GAME_OVER:
-            # await self._process_six_mans_replays(game)
-            asyncio.create_task(self._process_six_mans_replays(game))
+            if not self.account_manager_cog:
+                return
+            # outside the per-guild job limit so long running commands don't hold up automatic uploads
+            key = ('sixMansReplays', guild.id, game.id)
+            self.account_manager_cog.submit_job(guild, 'sixMansReplays', key, self._process_six_mans_replays, game, guild_limited=False)
             
 
 ###########################################################
 
 # ballchasing
-    async def _bc_delete_request(self, auth_token, endpoint, params=[]):
-        url = 'https://ballchasing.com/api'
-        url += endpoint
-        # params = [urllib.parse.quote(p) for p in params]
-        params = '&'.join(params)
-        if params:
-            url += "?{}".format(params)
-
-        # url = urllib.parse.quote_plus(url)
-        loop = asyncio.get_event_loop()
-        future = loop.run_in_executor(None, lambda: requests.delete(
-            url, headers={'Authorization': auth_token}))
-        response = await future
-        return response
-
-    async def _bc_get_request(self, auth_token, endpoint, params=[]):
-        url = 'https://ballchasing.com/api'
-        url += endpoint
-        # params = [urllib.parse.quote(p) for p in params]
-        params = '&'.join(params)
-        if params:
-            url += "?{}".format(params)
-
-        # url = urllib.parse.quote_plus(url)
-        loop = asyncio.get_event_loop()
-        future = loop.run_in_executor(None, lambda: requests.get(
-            url, headers={'Authorization': auth_token}))
-        response = await future
-        return response
-
-    async def _bc_post_request(self, auth_token, endpoint, params=[], json=None, data=None, files=None):
-        url = 'https://ballchasing.com/api'
-        url += endpoint
-        params = '&'.join(params)
-        if params:
-            url += "?{}".format(params)
-
-        # return requests.post(url, headers={'Authorization': auth_token}, json=json, data=data, files=files)
-        loop = asyncio.get_event_loop()
-        future = loop.run_in_executor(None, lambda: requests.post(
-            url, headers={'Authorization': auth_token}, json=json, data=data, files=files))
-        response = await future
-        return response
-
-    async def _bc_patch_request(self, auth_token, endpoint, params=[], json=None, data=None):
-        url = 'https://ballchasing.com/api'
-        url += endpoint
-        params = '&'.join(params)
-        if params:
-            url += "?{}".format(params)
-
-        # return requests.patch(url, headers={'Authorization': auth_token}, json=json, data=data)
-        loop = asyncio.get_event_loop()
-        future = loop.run_in_executor(None, lambda: requests.patch(
-            url, headers={'Authorization': auth_token}, json=json, data=data))
-        response = await future
-        return response
+    # requests are routed through the accountManager's shared ballchasing client
+    async def _bc_delete_request(self, auth_token, endpoint, params=[], priority=config.INTERACTIVE_PRIORITY):
+        return await self.account_manager_cog.bc_delete_request(auth_token, endpoint, params, priority=priority)
+
+    async def _bc_get_request(self, auth_token, endpoint, params=[], priority=config.INTERACTIVE_PRIORITY):
+        return await self.account_manager_cog.bc_get_request(auth_token, endpoint, params, priority=priority)
+
+    async def _bc_post_request(self, auth_token, endpoint, params=[], json=None, data=None, files=None, priority=config.INTERACTIVE_PRIORITY):
+        return await self.account_manager_cog.bc_post_request(auth_token, endpoint, params, json=json, data=data, files=files, priority=priority)
+
+    async def _bc_patch_request(self, auth_token, endpoint, params=[], json=None, data=None, priority=config.INTERACTIVE_PRIORITY):
+        return await self.account_manager_cog.bc_patch_request(auth_token, endpoint, params, json=json, data=data, priority=priority)
 
 # other commands
     async def pre_load_data(self):
@@ -270,12 +227,13 @@ class BCSixMans(commands.Cog):
         
         messages = await queue.send_message(embed=embed)
         embed_message = messages[0]
+        progress = ProgressReporter(embed_message)
 
 
         tlg = await self._get_top_level_group(guild)
         if not tlg:
             embed.description = f':x: ballchasing group group not found. An Admin must use the `{game.prefix}setBCGroup` command to enable automatic uploads'
-            await embed_message.edit(embed=embed)
+            await progress.finish(embed=embed)
             # for message in messages:
             #     await message.edit(embed=embed)
             return
@@ -287,28 +245,30 @@ class BCSixMans(commands.Cog):
             replay_ids, summary = replays_found
         if not replays_found:
             embed.description = ":x: No matching replays found."
-            await embed_message.edit(embed=embed)
+            await progress.finish(embed=embed)
             return
 
         channel = embed_message.channel # queue.channels[0]
 
         embed.description = f"{summary}"
-        await embed_message.edit(embed=embed)
+        progress.update(embed=embed)
 
         series_subgroup_id = await self._get_series_destination(game)
         if not series_subgroup_id:
             embed.description += "\n:x: series_subgroup_id not found."
-            await embed_message.edit(embed=embed)
+            await progress.finish(embed=embed)
             return
         
         embed.description += "\n\n:signal_strength: _Processing {} replays..._".format(len(replay_ids))
-        await embed_message.edit(embed=embed)
+        progress.update(embed=embed)
 
-        tmp_replay_files = await self._download_replays(guild, replay_ids)
-        uploaded_ids = await self._upload_replays(guild, series_subgroup_id, tmp_replay_files)
-        renamed = await self._rename_replays(guild, uploaded_ids)
+        uploaded_ids = await self._transfer_replays(guild, series_subgroup_id, replay_ids)
+        renamed, rename_failures = await self._rename_replays(guild, uploaded_ids)
 
         embed.description = summary
+        if rename_failures:
+            embed.description += "\n:x: {} replay(s) could not be renamed ({}).".format(
+                len(rename_failures), ", ".join(str(code) for code in sorted(set(rename_failures.values()))))
 
         try:
             dt = self.utc_to_guild_timezone(guild, game.textChannel.created_at)
@@ -319,7 +279,7 @@ class BCSixMans(commands.Cog):
             series_name = "Click Here to View!"
 
         embed.add_field(name="New Ballchasing Group Created!", value=f"[{series_name}](https://ballchasing.com/group/{series_subgroup_id})", inline=False)
-        await embed_message.edit(embed=embed)
+        await progress.finish(embed=embed)
         return
 
     async def _get_all_accounts(self, guild, member):
@@ -608,40 +568,20 @@ class BCSixMans(commands.Cog):
 
         return next_subgroup_id
 
-    async def _download_replays(self, guild, replay_ids):
-        auth_token = await self._get_auth_token(guild)
-        tmp_replay_files = []
-        this_game = 1
-        for replay_id in replay_ids[::-1]:
-            endpoint = "/replays/{}/file".format(replay_id)
-            r = await self._bc_get_request(auth_token, endpoint)
-            
-            # replay_filename = "Game {}.replay".format(this_game)
-            replay_filename = "{}.replay".format(replay_id)
-            
-            tf = tempfile.NamedTemporaryFile()
-            tf.name += ".replay"
-            tf.write(r.content)
-            tmp_replay_files.append(tf)
-            this_game += 1
-
-        return tmp_replay_files
-
-    async def _upload_replays(self, guild, subgroup_id, files_to_upload):
-        endpoint = "/v2/upload"
+    async def _transfer_replays(self, guild, subgroup_id, replay_ids):
+        """Streams replays into the subgroup (oldest first). Returns the ids of the replays now in the subgroup, in game order."""
         params = [
             'visibility={}'.format(config.visibility),
             'group={}'.format(subgroup_id)
         ]
         auth_token = await self._get_auth_token(guild)
+        responses = await self.account_manager_cog.bc_transfer_replays(auth_token, replay_ids[::-1], auth_token, params)
 
         replay_ids_in_group = []
-        for replay_file in files_to_upload:
-            replay_file.seek(0)
-            files = {'file': replay_file}
+        for r in responses:
+            if not r:
+                continue
 
-            r = await self._bc_post_request(auth_token, endpoint, params, files=files)
-        
             status_code = r.status_code
             data = r.json()
             
@@ -656,8 +596,6 @@ class BCSixMans(commands.Cog):
             except:
                 pass
                 # await ctx.send(":x: {} error: {}".format(status_code, data['error']))
-            
-            replay_file.close()
         
         return replay_ids_in_group
 
@@ -665,25 +603,22 @@ class BCSixMans(commands.Cog):
         pass
 
     async def _rename_replays(self, guild, uploaded_replays_ids):
+        """Titles the replays "Game N" in the given order, concurrently under the shared rate limiter.
+        Returns (renamed replay ids, {replay id: status code} for each rename that failed)"""
         auth_token = await self._get_auth_token(guild)
-        renamed = []
+        responses = await asyncio.gather(*[
+            self._bc_patch_request(auth_token, '/replays/{}'.format(replay_id), json={'title': 'Game {}'.format(game_number)})
+            for game_number, replay_id in enumerate(uploaded_replays_ids, 1)
+        ])
 
-        game_number = 1
-        for replay_id in uploaded_replays_ids:
-            endpoint = '/replays/{}'.format(replay_id)
-            payload = {
-                'title': 'Game {}'.format(game_number)
-            }
-            r = await self._bc_patch_request(auth_token, endpoint, json=payload)
-            status_code = r.status_code
-
-            if status_code == 204:
-                renamed.append(replay_id)            
+        renamed = []
+        failed = {}
+        for replay_id, r in zip(uploaded_replays_ids, responses):
+            if r.status_code == 204:
+                renamed.append(replay_id)
             else:
-                await print(":x: {} error.".format(status_code))
-
-            game_number += 1
-        return renamed
+                failed[replay_id] = r.status_code
+        return renamed, failed
 
     def utc_to_guild_timezone(self, guild, utc_dt: datetime):
         utc_dt = utc_dt.replace(tzinfo=UTC)
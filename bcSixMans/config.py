@@ -1,4 +1,5 @@
 from datetime import datetime
+from accountManager.config import config as account_config
 # Discord ID: Steam ID -- maybe handle multiple accounts?
 
 # ###############################################################################
@@ -10,6 +11,10 @@ class config:
     player_identification = 'by-id'                             # setting -- Alternative 'by-name'
     top_level_group = "hut-mans-test-dr0mge20kx"
 
+    # ballchasing rate limiter lanes, owned by the accountManager's client (lower is served first)
+    INTERACTIVE_PRIORITY = account_config.bc_interactive_priority
+    BACKGROUND_PRIORITY = account_config.bc_background_priority
+
     GS_GAME_OVER = "game over"
     GS_ONGOING = "ongoing"
 